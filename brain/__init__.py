@@ -17,8 +17,12 @@
 
 __version__ = "0.1.0"
 
+# Target time between blocks on the chain, in seconds
+BLOCK_TIME = 12
+
 from brain.protocol import (
     Statement,
+    EvidenceTable,
     PredictionResult,
     VerificationRequest,
     VerificationResponse,
@@ -26,17 +30,29 @@ from brain.protocol import (
     ValidationResponse
 )
 
-from brain.forward import get_verification_responses
+from brain.forward import (
+    get_verification_responses,
+    forward_verification_responses,
+    iter_verification_responses,
+    ensure_session,
+    serving_uids
+)
 from brain.reward import calculate_verification_reward, calculate_validation_reward
 
 __all__ = [
+    "BLOCK_TIME",
     "Statement",
+    "EvidenceTable",
     "PredictionResult",
     "VerificationRequest",
     "VerificationResponse",
     "ValidationRequest",
     "ValidationResponse",
     "get_verification_responses",
+    "forward_verification_responses",
+    "iter_verification_responses",
+    "ensure_session",
+    "serving_uids",
     "calculate_verification_reward",
     "calculate_validation_reward"
 ]
@@ -17,19 +17,135 @@
 
 import time
 import torch
+import orjson
+import asyncio
+import aiohttp
 import bittensor
-from typing import List, Tuple, Dict, Any, Optional
+import numpy as np
+from collections import deque
+from typing import List, Tuple, Dict, Any, Optional, Deque, AsyncIterator
 from brain.protocol import Statement, VerificationRequest, VerificationResponse
 
-def get_verification_responses(
+# Serving UIDs per metagraph, keyed by id(metagraph) and tagged with the block it was synced at.
+_SERVING_CACHE: Dict[int, Tuple[int, np.ndarray]] = {}
+
+def serving_uids(metagraph: 'bittensor.metagraph.Metagraph') -> np.ndarray:
+    """
+    Returns the UIDs of the axons that are serving the network.
+    
+    The scan over ``metagraph.axons`` is only redone when the metagraph has been
+    synced to a new block (or a different metagraph is passed in).
+    
+    Args:
+        metagraph: Bittensor metagraph containing network state.
+        
+    Returns:
+        uids: Sorted int32 array of the serving UIDs.
+    """
+    key = id(metagraph)
+    block = int(metagraph.block)
+    cached = _SERVING_CACHE.get(key)
+    if cached is None or cached[0] != block:
+        if cached is None:
+            # A new metagraph object supersedes the ones we have seen before.
+            _SERVING_CACHE.clear()
+        uids = np.array(
+            [uid for uid, axon in enumerate(metagraph.axons) if axon.is_serving],
+            dtype=np.int32
+        )
+        cached = _SERVING_CACHE[key] = (block, uids)
+    return cached[1]
+
+# Rolling window of recent response times per UID, used to time hedged requests.
+_LATENCY_WINDOW = 32
+_HEDGE_FACTOR = 1.5
+_LATENCIES: Dict[int, Deque[float]] = {}
+
+def _record_latencies(uids: List[int], times: List[float]):
+    """Adds the observed response times to each UID's rolling latency window."""
+    for uid, process_time in zip(uids, times):
+        if process_time is not None:
+            _LATENCIES.setdefault(uid, deque(maxlen=_LATENCY_WINDOW)).append(process_time)
+
+def _hedge_delay(uid: int) -> Optional[float]:
+    """Returns how long to wait on a UID before hedging, or None if it has no latency history."""
+    history = _LATENCIES.get(uid)
+    if not history:
+        return None
+    return _HEDGE_FACTOR * float(np.median(history))
+
+# Connection pool settings for the dendrite's HTTP transport.
+_CONNECTION_LIMIT = 256
+_DNS_CACHE_TTL = 300  # seconds
+_KEEPALIVE_TIMEOUT = 30  # seconds
+
+def _json_serialize(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+async def ensure_session(dendrite: 'bittensor.dendrite.Dendrite') -> aiohttp.ClientSession:
+    """
+    Installs a keep-alive connection pool on the dendrite if it does not have one yet.
+    
+    Connections to axons are reused across queries, and request bodies are encoded
+    with orjson via ``json_serialize``. Await it on the dendrite's event loop, since
+    the session is bound to that loop.
+    
+    Args:
+        dendrite: Bittensor dendrite for making RPC calls.
+        
+    Returns:
+        session: The dendrite's aiohttp session.
+    """
+    session = getattr(dendrite, "_session", None)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=_CONNECTION_LIMIT,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT
+            ),
+            json_serialize=_json_serialize
+        )
+        dendrite._session = session
+    return session
+
+def _run(coro):
+    """
+    Runs a coroutine to completion on the current thread's event loop.
+
+    The loop is reused across calls (rather than torn down by ``asyncio.run``)
+    so the dendrite's aiohttp session stays bound to a live loop between queries.
+    """
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+async def iter_verification_responses(
     metagraph: 'bittensor.metagraph.Metagraph',
     dendrite: 'bittensor.dendrite.Dendrite',
     statement: Statement,
     timeout: float = 12.0,
-    exclude: Optional[List[int]] = None
-) -> Tuple[List[VerificationResponse], List[float], List[int]]:
+    exclude: Optional[List[int]] = None,
+    batch_size: int = 32,
+    max_concurrency: int = 8,
+    hedge: bool = False
+) -> AsyncIterator[Tuple[VerificationResponse, float, int]]:
     """
-    Gets verification responses from miners in the network.
+    Asynchronously yields verification responses from miners as they arrive.
+    
+    Serving axons are split into batches of ``batch_size`` and at most
+    ``max_concurrency`` batches are in flight at once, so memory scales with the
+    batch size rather than the fleet size and slow batches do not block fast ones.
+    Each batch's responses are yielded as soon as the batch completes, so callers
+    can process early responses while stragglers are still being awaited.
+    
+    With ``hedge`` enabled, an axon that has not answered within 1.5x its median
+    observed latency is sent a duplicate request, and whichever copy answers
+    first is used. This hides transport stalls (dropped connections, slow
+    handshakes) without attributing another miner's answer to the UID.
     
     Args:
         metagraph: Bittensor metagraph containing network state.
@@ -37,41 +153,175 @@ def get_verification_responses(
         statement: The statement to be verified.
         timeout: Timeout for the request in seconds.
         exclude: List of axon indices to exclude from the request.
+        batch_size: Number of axons per query batch.
+        max_concurrency: Maximum number of batches in flight at once.
+        hedge: Whether to send hedged duplicate requests to slow axons.
         
-    Returns:
-        responses: List of verification responses.
-        times: List of response times.
-        uids: List of UIDs that were queried.
+    Yields:
+        (response, time, uid) for each successful response, in completion order.
     """
-    if exclude is None:
-        exclude = []
+    exclude = frozenset(exclude or ())
+    await ensure_session(dendrite)
         
     # Get UIDs of miners that are serving the network.
     serving_axons = [
-        uid for uid, axon in enumerate(metagraph.axons) 
-        if axon.is_serving and uid not in exclude
+        uid for uid in serving_uids(metagraph).tolist()
+        if uid not in exclude
     ]
     
     # Create the verification request.
     request = VerificationRequest(statement=statement)
     
-    # Get responses from the network.
-    responses = dendrite.query(
-        axons=[metagraph.axons[uid] for uid in serving_axons],
-        synapse=request,
-        deserialize=True,
-        timeout=timeout
-    )
-    
-    # Process responses and filter out failures.
-    successful_responses = []
-    successful_times = []
-    successful_uids = []
-    
-    for i, (response, uid) in enumerate(zip(responses, serving_axons)):
-        if isinstance(response, VerificationResponse):
-            successful_responses.append(response)
-            successful_times.append(response.dendrite.process_time)
-            successful_uids.append(uid)
+    # Split the serving axons into batches, gated by a semaphore.
+    semaphore = asyncio.Semaphore(max_concurrency)
+    batches = [
+        serving_axons[i:i + batch_size]
+        for i in range(0, len(serving_axons), batch_size)
+    ]
+    
+    def send(uid, send_timeout):
+        return asyncio.ensure_future(dendrite.forward(
+            axons=metagraph.axons[uid],
+            synapse=request,
+            deserialize=True,
+            timeout=send_timeout
+        ))
     
+    async def query_axon(uid):
+        primary = send(uid, timeout)
+        pending = {primary}
+        # Cancel whatever is still in flight when we return or are cancelled ourselves.
+        try:
+            delay = _hedge_delay(uid) if hedge else None
+            if delay is None or delay >= timeout:
+                return await primary
+            
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+            
+            # Hedge with a duplicate request that still ends at the original deadline.
+            pending.add(send(uid, timeout - delay))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and isinstance(task.result(), VerificationResponse):
+                        return task.result()
+            return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def query_batch(batch):
+        async with semaphore:
+            responses = await asyncio.gather(
+                *(query_axon(uid) for uid in batch),
+                return_exceptions=True
+            )
+        return batch, responses
+    
+    # Get responses from the network, yielding each batch as it completes.
+    tasks = [asyncio.ensure_future(query_batch(batch)) for batch in batches]
+    try:
+        for next_batch in asyncio.as_completed(tasks):
+            batch, responses = await next_batch
+            
+            # Filter out failures.
+            for uid, response in zip(batch, responses):
+                if isinstance(response, VerificationResponse):
+                    process_time = response.dendrite.process_time
+                    _record_latencies([uid], [process_time])
+                    yield response, process_time, uid
+    finally:
+        # Stop outstanding queries if the caller stops consuming early.
+        for task in tasks:
+            task.cancel()
+
+async def forward_verification_responses(
+    metagraph: 'bittensor.metagraph.Metagraph',
+    dendrite: 'bittensor.dendrite.Dendrite',
+    statement: Statement,
+    timeout: float = 12.0,
+    exclude: Optional[List[int]] = None,
+    batch_size: int = 32,
+    max_concurrency: int = 8,
+    hedge: bool = False
+) -> Tuple[List[VerificationResponse], List[float], List[int]]:
+    """
+    Asynchronously gets verification responses from miners in the network.
+    
+    Collects everything yielded by :func:`iter_verification_responses`.
+    
+    Args:
+        metagraph: Bittensor metagraph containing network state.
+        dendrite: Bittensor dendrite for making RPC calls.
+        statement: The statement to be verified.
+        timeout: Timeout for the request in seconds.
+        exclude: List of axon indices to exclude from the request.
+        batch_size: Number of axons per query batch.
+        max_concurrency: Maximum number of batches in flight at once.
+        hedge: Whether to send hedged duplicate requests to slow axons.
+        
+    Returns:
+        responses: List of verification responses.
+        times: List of response times.
+        uids: List of UIDs that were queried.
+    """
+    successful = [
+        item async for item in iter_verification_responses(
+            metagraph=metagraph,
+            dendrite=dendrite,
+            statement=statement,
+            timeout=timeout,
+            exclude=exclude,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            hedge=hedge
+        )
+    ]
+    if not successful:
+        return [], [], []
+    
+    successful_responses, successful_times, successful_uids = map(list, zip(*successful))
     return successful_responses, successful_times, successful_uids
+
+def get_verification_responses(
+    metagraph: 'bittensor.metagraph.Metagraph',
+    dendrite: 'bittensor.dendrite.Dendrite',
+    statement: Statement,
+    timeout: float = 12.0,
+    exclude: Optional[List[int]] = None,
+    batch_size: int = 32,
+    max_concurrency: int = 8,
+    hedge: bool = False
+) -> Tuple[List[VerificationResponse], List[float], List[int]]:
+    """
+    Gets verification responses from miners in the network.
+    
+    Synchronous wrapper around :func:`forward_verification_responses`.
+    
+    Args:
+        metagraph: Bittensor metagraph containing network state.
+        dendrite: Bittensor dendrite for making RPC calls.
+        statement: The statement to be verified.
+        timeout: Timeout for the request in seconds.
+        exclude: List of axon indices to exclude from the request.
+        batch_size: Number of axons per query batch.
+        max_concurrency: Maximum number of batches in flight at once.
+        hedge: Whether to send hedged duplicate requests to slow axons.
+        
+    Returns:
+        responses: List of verification responses.
+        times: List of response times.
+        uids: List of UIDs that were queried.
+    """
+    return _run(forward_verification_responses(
+        metagraph=metagraph,
+        dendrite=dendrite,
+        statement=statement,
+        timeout=timeout,
+        exclude=exclude,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+        hedge=hedge
+    ))
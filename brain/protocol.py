@@ -15,10 +15,21 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import orjson
 import bittensor
 import pydantic
 from typing import List, Optional, Dict, Any, Union
 
+def _orjson_dumps(value: Any, *, default: Any) -> str:
+    return orjson.dumps(value, default=default).decode()
+
+class _OrjsonConfig:
+    """
+    Pydantic config shared by the protocol models, (de)serializing JSON with orjson.
+    """
+    json_loads = orjson.loads
+    json_dumps = _orjson_dumps
+
 class Statement(pydantic.BaseModel):
     """
     Represents a statement to be verified by the miners.
@@ -28,6 +39,42 @@ class Statement(pydantic.BaseModel):
     timestamp: str  # ISO format timestamp
     context: Optional[Dict[str, Any]] = None
     
+    class Config(_OrjsonConfig):
+        frozen = True
+        extra = "forbid"
+    
+class EvidenceTable(pydantic.BaseModel):
+    """
+    Represents the evidence supporting a prediction result, stored column-wise.
+    
+    Each list holds one field for every piece of evidence, so all lists have the
+    same length and row ``i`` is spread across index ``i`` of each of them.
+    """
+    sources: List[str] = []
+    titles: List[str] = []
+    contents: List[str] = []
+    urls: List[str] = []
+    retrieved_at: List[str] = []  # ISO format timestamps
+    
+    class Config(_OrjsonConfig):
+        frozen = True
+        
+    def __len__(self) -> int:
+        return len(self.sources)
+    
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> 'EvidenceTable':
+        """
+        Builds a table from a list of evidence dicts, as returned by search tools and LLMs.
+        """
+        return cls(
+            sources=[str(r.get("source", "")) for r in records],
+            titles=[str(r.get("title", "")) for r in records],
+            contents=[str(r.get("content", "")) for r in records],
+            urls=[str(r.get("url", "")) for r in records],
+            retrieved_at=[str(r.get("retrieved_at", "")) for r in records]
+        )
+    
 class PredictionResult(pydantic.BaseModel):
     """
     Represents the result of a prediction market verification.
@@ -36,15 +83,29 @@ class PredictionResult(pydantic.BaseModel):
     is_true: bool
     confidence: float  # 0.0 to 1.0
     explanation: str
-    evidence: List[Dict[str, Any]]
+    evidence: EvidenceTable
     methodology: str  # Description of how the result was determined
     
+    class Config(_OrjsonConfig):
+        frozen = True
+        extra = "forbid"
+        
+    @pydantic.validator("evidence", pre=True)
+    def _evidence_from_records(cls, value):
+        # Accept the row-wise list of evidence dicts produced by miners.
+        if isinstance(value, list):
+            return EvidenceTable.from_records(value)
+        return value
+    
 class VerificationRequest(bittensor.Synapse):
     """
     Represents a request from a validator to a miner to verify a statement.
     """
     statement: Statement
     
+    class Config(_OrjsonConfig):
+        pass
+    
     def deserialize(self) -> 'VerificationRequest':
         return self
         
@@ -56,6 +117,9 @@ class VerificationResponse(bittensor.Synapse):
     computation_time: float  # Time taken to compute the result in seconds
     version: str  # Version of the miner software
     
+    class Config(_OrjsonConfig):
+        pass
+    
     def deserialize(self) -> 'VerificationResponse':
         return self
 
@@ -66,6 +130,9 @@ class ValidationRequest(bittensor.Synapse):
     statement: Statement
     miner_result: PredictionResult
     
+    class Config(_OrjsonConfig):
+        pass
+    
     def deserialize(self) -> 'ValidationRequest':
         return self
         
@@ -78,5 +145,8 @@ class ValidationResponse(bittensor.Synapse):
     explanation: str
     alternative_result: Optional[PredictionResult] = None
     
+    class Config(_OrjsonConfig):
+        pass
+    
     def deserialize(self) -> 'ValidationResponse':
         return self
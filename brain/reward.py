@@ -17,9 +17,121 @@
 
 import torch
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, NamedTuple
 from brain.protocol import VerificationResponse, ValidationResponse, PredictionResult
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to plain NumPy
+    njit = None
+
+# Rewards are summed in float64 and cast to float32 once at the end, like the original
+# scalar arithmetic, so that scores sitting exactly on a threshold round the same way.
+# Normalizers for the quality metrics
+_EVIDENCE_DIV = np.float64(5.0)  # Max 5 pieces of evidence
+_EXPLANATION_DIV = np.float64(500.0)
+_METHODOLOGY_DIV = np.float64(300.0)
+_VALIDATION_EXPLANATION_DIV = np.float64(300.0)
+
+# Verification weights when ground truth is available
+_GT_ACCURACY_W = np.float64(0.6)
+_GT_EVIDENCE_W = np.float64(0.25)
+_GT_EXPLANATION_W = np.float64(0.15)
+
+# Verification weights when scoring against consensus
+_CONSENSUS_W = np.float64(0.4)
+_CONSENSUS_EVIDENCE_W = np.float64(0.3)
+_CONSENSUS_EXPLANATION_W = np.float64(0.15)
+_CONSENSUS_METHODOLOGY_W = np.float64(0.15)
+
+# Validation thresholds, scores and weights
+_HIGH_REWARD = np.float32(0.7)  # compared with float32 rewards, like the float32 tensors they come from
+_LOW_REWARD = np.float32(0.3)
+_CORRECT_SCORE = np.float64(0.9)
+_INCORRECT_SCORE = np.float64(0.1)
+_NEUTRAL_SCORE = np.float64(0.5)
+_ALTERNATIVE_SCORE = np.float64(0.2)
+_QUALITY_W = np.float64(0.6)
+_VALIDATION_EXPLANATION_W = np.float64(0.3)
+_ALTERNATIVE_W = np.float64(0.1)
+
+_ONE = np.float64(1.0)
+_ZERO = np.float64(0.0)
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _verification_reward_gt_kernel(is_true, confidence, gt, evidence_len, explanation_len):
+        """
+        Fused ground-truth verification reward, one pass over the responses.
+        """
+        out = np.empty_like(confidence)
+        for i in range(confidence.size):
+            accuracy_score = confidence[i] if is_true[i] == gt else _ONE - confidence[i]
+            evidence_quality = min(_ONE, evidence_len[i] / _EVIDENCE_DIV)
+            explanation_quality = min(_ONE, explanation_len[i] / _EXPLANATION_DIV)
+            out[i] = _GT_ACCURACY_W * accuracy_score + _GT_EVIDENCE_W * evidence_quality + _GT_EXPLANATION_W * explanation_quality
+        return out
+else:
+    _verification_reward_gt_kernel = None
+
+class ResponseSummary(NamedTuple):
+    """
+    Per-response fields of a list of verification responses, as arrays.
+    """
+    is_true: np.ndarray
+    confidence: np.ndarray
+    evidence_len: np.ndarray
+    explanation_len: np.ndarray
+    methodology_len: np.ndarray
+
+class ValidationSummary(NamedTuple):
+    """
+    Per-response fields of a list of validation responses, as arrays.
+    """
+    is_valid: np.ndarray
+    explanation_len: np.ndarray
+    has_alternative: np.ndarray
+
+def _summarize_responses(responses: List[VerificationResponse]) -> ResponseSummary:
+    """
+    Extracts the fields used for scoring from verification responses in a single pass.
+    """
+    is_true, confidence, evidence_len, explanation_len, methodology_len = zip(*(
+        (
+            r.result.is_true,
+            r.result.confidence,
+            len(r.result.evidence),
+            len(r.result.explanation),
+            len(r.result.methodology)
+        )
+        for r in responses
+    ))
+    return ResponseSummary(
+        is_true=np.asarray(is_true, dtype=bool),
+        confidence=np.asarray(confidence, dtype=np.float64),
+        evidence_len=np.asarray(evidence_len, dtype=np.float64),
+        explanation_len=np.asarray(explanation_len, dtype=np.float64),
+        methodology_len=np.asarray(methodology_len, dtype=np.float64)
+    )
+
+def _summarize_validation_responses(validation_responses: List[ValidationResponse]) -> ValidationSummary:
+    """
+    Extracts the fields used for scoring from validation responses in a single pass.
+    """
+    is_valid, explanation_len, has_alternative = zip(*(
+        (
+            v.is_valid,
+            len(v.explanation),
+            (not v.is_valid) and v.alternative_result is not None
+        )
+        for v in validation_responses
+    ))
+    return ValidationSummary(
+        is_valid=np.asarray(is_valid, dtype=bool),
+        explanation_len=np.asarray(explanation_len, dtype=np.float64),
+        has_alternative=np.asarray(has_alternative, dtype=bool)
+    )
+
 def calculate_verification_reward(
     responses: List[VerificationResponse],
     ground_truth: Dict[str, Any] = None
@@ -35,52 +147,55 @@ def calculate_verification_reward(
         rewards: Tensor of rewards for each response.
     """
     if len(responses) == 0:
-        return torch.tensor([])
+        return torch.empty(0, dtype=torch.float32)
         
-    # Initialize rewards
-    rewards = torch.zeros(len(responses))
+    n = len(responses)
+    
+    # Extract the per-response fields into arrays once
+    summary = _summarize_responses(responses)
+    is_true = summary.is_true
+    confidence = summary.confidence
+    
+    # If ground truth is available and numba is installed, use the fused kernel
+    if ground_truth is not None and _verification_reward_gt_kernel is not None:
+        rewards = _verification_reward_gt_kernel(
+            is_true,
+            confidence,
+            bool(ground_truth.get('is_true', False)),
+            summary.evidence_len,
+            summary.explanation_len
+        )
+        return torch.from_numpy(np.ascontiguousarray(rewards, dtype=np.float32))
+    
+    # Evaluate quality of evidence and explanation
+    evidence_quality = np.minimum(_ONE, summary.evidence_len / _EVIDENCE_DIV)  # Normalize, max 5 pieces of evidence
+    explanation_quality = np.minimum(_ONE, summary.explanation_len / _EXPLANATION_DIV)  # Normalize based on length
     
     # If ground truth is available, use it to calculate accuracy rewards
     if ground_truth is not None:
-        for i, response in enumerate(responses):
-            # Check if the miner's prediction matches ground truth
-            if response.result.is_true == ground_truth.get('is_true', False):
-                # Reward based on confidence - higher confidence for correct answers gets higher reward
-                accuracy_score = response.result.confidence
-            else:
-                # Penalize high confidence for wrong answers
-                accuracy_score = 1.0 - response.result.confidence
-                
-            # Evaluate quality of evidence and explanation
-            evidence_quality = min(1.0, len(response.result.evidence) / 5.0)  # Normalize, max 5 pieces of evidence
-            explanation_quality = min(1.0, len(response.result.explanation) / 500.0)  # Normalize based on length
-            
-            # Combine scores with weights
-            rewards[i] = 0.6 * accuracy_score + 0.25 * evidence_quality + 0.15 * explanation_quality
+        # Reward confidence on correct answers, penalize high confidence on wrong answers
+        accuracy_score = np.where(is_true == ground_truth.get('is_true', False), confidence, _ONE - confidence)
+        
+        # Combine scores with weights
+        rewards = _GT_ACCURACY_W * accuracy_score + _GT_EVIDENCE_W * evidence_quality + _GT_EXPLANATION_W * explanation_quality
     else:
         # Without ground truth, use consensus and quality metrics
-        # Extract predictions and confidences
-        predictions = [r.result.is_true for r in responses]
-        confidences = [r.result.confidence for r in responses]
+        # Calculate consensus (majority vote) and reward agreement with it
+        consensus = 2 * np.count_nonzero(is_true) > n
+        consensus_agreement = (is_true == consensus).astype(np.float64)
         
-        # Calculate consensus (majority vote)
-        consensus = sum(predictions) > len(predictions) / 2
+        # Evaluate methodology
+        methodology_score = np.minimum(_ONE, summary.methodology_len / _METHODOLOGY_DIV)
         
-        for i, response in enumerate(responses):
-            # Reward agreement with consensus
-            consensus_agreement = 1.0 if response.result.is_true == consensus else 0.0
-            
-            # Evaluate quality of evidence and explanation
-            evidence_quality = min(1.0, len(response.result.evidence) / 5.0)
-            explanation_quality = min(1.0, len(response.result.explanation) / 500.0)
-            
-            # Evaluate methodology
-            methodology_score = min(1.0, len(response.result.methodology) / 300.0)
-            
-            # Combine scores with weights
-            rewards[i] = 0.4 * consensus_agreement + 0.3 * evidence_quality + 0.15 * explanation_quality + 0.15 * methodology_score
+        # Combine scores with weights
+        rewards = (
+            _CONSENSUS_W * consensus_agreement
+            + _CONSENSUS_EVIDENCE_W * evidence_quality
+            + _CONSENSUS_EXPLANATION_W * explanation_quality
+            + _CONSENSUS_METHODOLOGY_W * methodology_score
+        )
     
-    return rewards
+    return torch.from_numpy(np.ascontiguousarray(rewards, dtype=np.float32))
 
 def calculate_validation_reward(
     validation_responses: List[ValidationResponse],
@@ -99,40 +214,34 @@ def calculate_validation_reward(
         rewards: Tensor of rewards for each validation response.
     """
     if len(validation_responses) == 0:
-        return torch.tensor([])
+        return torch.empty(0, dtype=torch.float32)
         
-    # Initialize rewards
-    rewards = torch.zeros(len(validation_responses))
+    n = len(validation_responses)
     
-    # For each validation response
-    for i, val_response in enumerate(validation_responses):
-        # Get the verification response being validated
-        ver_response = verification_responses[i % len(verification_responses)]
-        ver_reward = verification_rewards[i % len(verification_rewards)]
-        
-        # Higher reward for correctly identifying high-quality responses
-        if val_response.is_valid and ver_reward > 0.7:
-            quality_score = 0.9
-        # Higher reward for correctly identifying low-quality responses
-        elif not val_response.is_valid and ver_reward < 0.3:
-            quality_score = 0.9
-        # Penalize incorrect validation
-        elif val_response.is_valid and ver_reward < 0.3:
-            quality_score = 0.1
-        elif not val_response.is_valid and ver_reward > 0.7:
-            quality_score = 0.1
-        else:
-            quality_score = 0.5
-            
-        # Reward for providing detailed explanation
-        explanation_quality = min(1.0, len(val_response.explanation) / 300.0)
-        
-        # Reward for providing alternative result when validation fails
-        alternative_quality = 0.0
-        if not val_response.is_valid and val_response.alternative_result is not None:
-            alternative_quality = 0.2
-            
-        # Combine scores with weights
-        rewards[i] = 0.6 * quality_score + 0.3 * explanation_quality + 0.1 * alternative_quality
+    # Extract the per-response fields into arrays once
+    summary = _summarize_validation_responses(validation_responses)
+    is_valid = summary.is_valid
+    
+    # Get the reward of the verification response being validated
+    ver_reward = np.take(verification_rewards.detach().cpu().numpy(), np.arange(n), mode='wrap')
+    high = ver_reward > _HIGH_REWARD
+    low = ver_reward < _LOW_REWARD
+    
+    # Higher reward for correctly identifying high- and low-quality responses,
+    # penalize incorrect validation
+    quality_score = np.select(
+        [is_valid & high, ~is_valid & low, is_valid & low, ~is_valid & high],
+        [_CORRECT_SCORE, _CORRECT_SCORE, _INCORRECT_SCORE, _INCORRECT_SCORE],
+        default=_NEUTRAL_SCORE
+    )
+    
+    # Reward for providing detailed explanation
+    explanation_quality = np.minimum(_ONE, summary.explanation_len / _VALIDATION_EXPLANATION_DIV)
+    
+    # Reward for providing alternative result when validation fails
+    alternative_quality = np.where(summary.has_alternative, _ALTERNATIVE_SCORE, _ZERO)
+    
+    # Combine scores with weights
+    rewards = _QUALITY_W * quality_score + _VALIDATION_EXPLANATION_W * explanation_quality + _ALTERNATIVE_W * alternative_quality
     
-    return rewards
+    return torch.from_numpy(np.ascontiguousarray(rewards, dtype=np.float32))
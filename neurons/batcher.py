@@ -0,0 +1,123 @@
+# The MIT License (MIT)
+# Copyright © 2023 Bittensor "Brain" Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+import queue
+import threading
+import bittensor
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, List, Optional, Tuple
+
+from brain.protocol import Statement
+
+class VerificationBatcher:
+    """
+    Groups concurrent verification requests into batched LLM calls.
+    
+    Statements submitted within ``window`` seconds of the first pending one, up to
+    ``max_batch_size`` of them, are verified together by ``verify_batch``. A
+    statement that arrives alone goes through ``verify_single``, and so does every
+    statement of a batch whose combined answer cannot be used.
+    
+    The collector thread only groups statements; every batch and every single
+    call runs on ``executor``, so several LLM calls can be in flight at once.
+    """
+    
+    def __init__(
+        self,
+        verify_single: Callable[[Statement], Any],
+        verify_batch: Callable[[List[Statement]], List[Any]],
+        max_batch_size: int = 16,
+        window: float = 0.05,
+        executor: Optional[Executor] = None
+    ):
+        """Initialize the batcher and start its collector thread."""
+        self.verify_single = verify_single
+        self.verify_batch = verify_batch
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.executor = executor
+        
+        self._queue: "queue.Queue[Tuple[Statement, Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="verification-batcher", daemon=True)
+        self._thread.start()
+        
+    def submit(self, statement: Statement) -> Future:
+        """
+        Queues a statement for verification.
+        
+        Args:
+            statement: The statement to verify.
+            
+        Returns:
+            A future resolved with the verification result.
+        """
+        future = Future()
+        self._queue.put((statement, future))
+        return future
+        
+    def _run(self):
+        """Collects pending statements into batches and dispatches them."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._submit(self._dispatch, batch)
+            
+    def _submit(self, fn: Callable, *args: Any):
+        """Runs ``fn`` on the executor, or inline if there is none."""
+        if self.executor is None:
+            fn(*args)
+        else:
+            self.executor.submit(fn, *args)
+            
+    def _dispatch(self, batch: List[Tuple[Statement, Future]]):
+        """Verifies a batch and resolves its futures."""
+        # Skip statements whose caller stopped waiting
+        batch = [(statement, future) for statement, future in batch if future.set_running_or_notify_cancel()]
+        if len(batch) == 1:
+            self._verify_single(*batch[0])
+            return
+        if not batch:
+            return
+        
+        try:
+            results = self.verify_batch([statement for statement, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Expected {len(batch)} batch results, got {len(results)}")
+        except Exception as e:
+            bittensor.logging.warning(f"Batch verification failed, falling back to single calls: {str(e)}")
+            for statement, future in batch:
+                self._submit(self._verify_single, statement, future)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+            
+    def _verify_single(self, statement: Statement, future: Future):
+        """Verifies one statement and resolves its future."""
+        try:
+            future.set_result(self.verify_single(statement))
+        except Exception as e:
+            future.set_exception(e)
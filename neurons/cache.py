@@ -0,0 +1,243 @@
+# The MIT License (MIT)
+# Copyright © 2023 Bittensor "Brain" Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import re
+import time
+import zlib
+import hashlib
+import tempfile
+import threading
+import orjson
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_NUMBER_RE = re.compile(r"\$?(\d[\d,]*(?:\.\d+)?)\s*([kmb%](?![a-z]))?", re.I)
+_ENTITY_RE = re.compile(r"\b[A-Z][a-zA-Z]+")
+_MULTIPLIERS = {"k": 1e3, "m": 1e6, "b": 1e9}
+
+# Words that flip or bound the meaning of a statement, normalized to one token per class
+_COMPARATORS = [
+    (">=", re.compile(r"\b(?:at least|no less than|or more)\b", re.I)),
+    ("<=", re.compile(r"\b(?:at most|no more than|or less)\b", re.I)),
+    (">", re.compile(r"\b(?:above|over|exceed(?:s|ed)?|more than|greater than|higher than|surpass(?:es|ed)?|top(?:s|ped)?)\b", re.I)),
+    ("<", re.compile(r"\b(?:below|under|less than|lower than|beneath)\b", re.I)),
+]
+_NEGATION_RE = re.compile(r"n't\b|\b(?:not|no|never|none|neither|nor|without|false|fail(?:s|ed)?|no longer)\b", re.I)
+
+def fingerprint(text: str) -> Tuple[str, ...]:
+    """
+    Extracts the lexical fingerprint of a statement: its capitalized words in
+    order of appearance, numbers, comparators and negations.
+    
+    Two statements can only share a cache entry if their fingerprints are equal,
+    so "Bitcoin above $60k" never matches "Bitcoin above $70k", "Bitcoin below
+    $60k", "Ethereum above $60k" or "Bitcoin did not close above $60k" however
+    similar the rest of the wording is. Keeping the capitalized words in order
+    also tells "Bitcoin closed higher than Ethereum" from its reverse.
+    
+    Args:
+        text: The text of the statement.
+        
+    Returns:
+        Tuple of the lower-cased capitalized words in order, followed by the
+        sorted normalized numbers, comparator classes and a negation marker.
+    """
+    entities = tuple(dict.fromkeys(entity.lower() for entity in _ENTITY_RE.findall(text)))
+    parts = set()
+    for number, suffix in _NUMBER_RE.findall(text):
+        value = float(number.replace(",", ""))
+        suffix = suffix.lower()
+        if suffix in _MULTIPLIERS:
+            value *= _MULTIPLIERS[suffix]
+        parts.add(f"{value:g}%" if suffix == "%" else f"{value:g}")
+    parts.update(f"cmp:{op}" for op, pattern in _COMPARATORS if pattern.search(text))
+    if _NEGATION_RE.search(text):
+        parts.add("neg")
+    return entities + tuple(sorted(parts))
+
+def embed(text: str, dim: int = 1024) -> np.ndarray:
+    """
+    Embeds a statement as an L2-normalized, feature-hashed bag of words.
+    
+    Numbers are left out, since the fingerprint already compares them exactly
+    whatever their formatting.
+    
+    Args:
+        text: The text of the statement.
+        dim: Dimension of the embedding.
+        
+    Returns:
+        Float32 vector of length ``dim``.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    for token in _TOKEN_RE.findall(_NUMBER_RE.sub(" ", text).lower()):
+        vector[zlib.crc32(token.encode("utf-8")) % dim] += 1.0
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+class SemanticCache:
+    """
+    Cache of verification results keyed by statement similarity.
+    
+    A lookup hits when a stored statement has the same fingerprint and a cosine
+    similarity of at least ``threshold``. Entries expire after ``ttl`` seconds and
+    the least recently used entry is evicted once ``max_size`` is reached.
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl: float = 3600.0, threshold: float = 0.95, dim: int = 1024):
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self.threshold = threshold
+        self.dim = dim
+        
+        # Embeddings live in one preallocated matrix, one row per slot
+        self._vectors = np.zeros((max_size, dim), dtype=np.float32)
+        self._entries: "OrderedDict[int, Tuple[Tuple[str, ...], float, Any]]" = OrderedDict()
+        self._by_fingerprint: Dict[Tuple[str, ...], Set[int]] = {}
+        self._free: List[int] = list(range(max_size - 1, -1, -1))
+        self._lock = threading.Lock()
+        
+    def __len__(self) -> int:
+        return len(self._entries)
+        
+    def get(self, text: str) -> Optional[Any]:
+        """
+        Looks up the result cached for a statement similar to ``text``.
+        
+        Args:
+            text: The text of the statement.
+            
+        Returns:
+            The cached value, or None on a miss.
+        """
+        key = fingerprint(text)
+        vector = embed(text, self.dim)
+        now = time.monotonic()
+        
+        with self._lock:
+            slots = [slot for slot in list(self._by_fingerprint.get(key, ())) if not self._expire(slot, now)]
+            if not slots:
+                return None
+            
+            similarity = self._vectors[slots] @ vector
+            best = int(np.argmax(similarity))
+            if similarity[best] < self.threshold:
+                return None
+            
+            slot = slots[best]
+            self._entries.move_to_end(slot)
+            return self._entries[slot][2]
+        
+    def put(self, text: str, value: Any):
+        """
+        Caches ``value`` as the result for the statement ``text``.
+        
+        Args:
+            text: The text of the statement.
+            value: The verification result to cache.
+        """
+        key = fingerprint(text)
+        vector = embed(text, self.dim)
+        
+        with self._lock:
+            if not self._free:
+                self._evict(next(iter(self._entries)))
+            slot = self._free.pop()
+            self._vectors[slot] = vector
+            self._entries[slot] = (key, time.monotonic(), value)
+            self._by_fingerprint.setdefault(key, set()).add(slot)
+            
+    def _expire(self, slot: int, now: float) -> bool:
+        """Evicts the entry in ``slot`` if it is older than the TTL."""
+        if now - self._entries[slot][1] > self.ttl:
+            self._evict(slot)
+            return True
+        return False
+        
+    def _evict(self, slot: int):
+        """Removes the entry in ``slot`` and returns the slot to the free list."""
+        key, _, _ = self._entries.pop(slot)
+        slots = self._by_fingerprint[key]
+        slots.discard(slot)
+        if not slots:
+            del self._by_fingerprint[key]
+        self._free.append(slot)
+
+class DiskCache:
+    """
+    Exact-match cache of verification results stored as JSON files on disk.
+    
+    Each statement text maps to one file named after its BLAKE2b digest, so the
+    cache survives restarts and can be shared by miners on the same host. Entries
+    older than ``ttl`` seconds, by file modification time, are treated as misses.
+    """
+    
+    def __init__(self, cache_dir: str, ttl: float = 3600.0):
+        """Initialize the cache, creating ``cache_dir`` if needed."""
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+        
+    def _path(self, text: str) -> str:
+        """Returns the file holding the entry for ``text``."""
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, key + ".json")
+    
+    def get(self, text: str) -> Optional[Any]:
+        """
+        Looks up the result cached for exactly ``text``.
+        
+        Args:
+            text: The text of the statement.
+            
+        Returns:
+            The cached value, or None on a miss.
+        """
+        path = self._path(text)
+        try:
+            if time.time() - os.stat(path).st_mtime > self.ttl:
+                return None
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        
+    def put(self, text: str, value: Any):
+        """
+        Caches ``value`` as the result for the statement ``text``.
+        
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partially written entry.
+        
+        Args:
+            text: The text of the statement.
+            value: The JSON-serializable verification result to cache.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(value))
+            os.replace(tmp_path, self._path(text))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,98 @@
+import os
+import orjson
+import functools
+from typing import Dict, List
+
+MODEL = "deepseek-chat"
+BASE_URL = "https://api.deepseek.com"
+
+# Deterministic sampling, so that cached answers match what the model would return
+TEMPERATURE = 0.0
+SEED = 0
+
+# HTTP connection pool for the LLM client
+MAX_KEEPALIVE_CONNECTIONS = 20
+MAX_CONNECTIONS = 100
+KEEPALIVE_EXPIRY = 30.0  # seconds
+REQUEST_TIMEOUT = 30.0  # seconds
+
+# Worker threads for the miner's batched and single LLM calls
+THREAD_POOL_SIZE = int(os.environ.get("THREAD_POOL_SIZE", 32))
+
+@functools.lru_cache(maxsize=None)
+def get_api_key() -> str:
+    """Returns the DeepSeek API key, read from the environment on first use."""
+    api_key = os.environ.get("DEEPSEEK_API_KEY")
+    if not api_key:
+        raise RuntimeError("The DEEPSEEK_API_KEY environment variable is not set")
+    return api_key
+
+SYSTEM_PROMPT = '''
+You are an expert in research and analysis statements
+'''
+
+VERIFY_PROMPT = '''
+Your main task is to verify the provided statements by determining if they are true or false with confidence intervals
+
+### REQUIREMENT
+1. Return the output in json format
+2. Example:
+{
+    "is_true": True,
+    "confidence": 0.8,
+    "evidence": [
+        {
+            "source": "example.com",
+            "title": "Example Evidence",
+            "content": "This is example evidence content.",
+            "url": "https://example.com/evidence",
+            "retrieved_at": datetime.datetime.now().isoformat()
+        },
+        {
+            "source": "example1.com",
+            "title": "Example Evidence1",
+            "content": "This is example evidence1 content.",
+            "url": "https://example.com/evidence1",
+            "retrieved_at": datetime.datetime.now().isoformat()
+        }
+    ],
+    "explanation": "The reasoning that led from the evidence to the determination.",
+    "methodology": "How the determination was made, e.g. which sources were cross-referenced."
+}
+3. Explain for output field:
+- is_true: Boolean indicating if the statement is true.
+- confidence: Float between 0 and 1 indicating confidence.
+- evidence: List of evidence supporting the determination (must contain at least 5 evidences)
+- explanation: String explaining the reasoning behind the determination.
+- methodology: String describing how the result was determined.
+
+4. Importance
+- Output must has at least 5 evidences
+
+### STATEMENT
+'''
+
+VERIFY_BATCH_PROMPT = VERIFY_PROMPT.rsplit("### STATEMENT", 1)[0] + '''5. Batch
+- You are given a JSON array of statements instead of a single statement
+- Return a JSON array with one output object per statement, in the same order as the statements
+
+### STATEMENTS
+'''
+
+# The prompt must ask for every field PredictionResult requires.
+assert all(field in VERIFY_PROMPT for field in ("explanation", "methodology", "evidence"))
+
+# Used when the model omits the explanation or methodology field.
+DEFAULT_METHODOLOGY = 'empirical observation, logical reasoning, mathematical proof, experimentation, cross-referencing reliable sources, expert testimony, statistical analysis, historical validation, falsifiability testing, and consistency checking within known frameworks or systems, Bayesian inference, peer review, case study analysis, content analysis, analogical reasoning, simulation modeling, forensic investigation, root cause analysis, triangulation, deduction and induction, legal precedent evaluation, field testing, axiomatic validation, comparative analysis, and heuristic checks.'
+
+# The static part of the chat request is composed once at import time,
+# only the statement text varies between requests.
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+def build_verify_messages(statement_text: str) -> List[Dict[str, str]]:
+    """Returns the chat messages asking the model to verify ``statement_text``."""
+    return [SYSTEM_MESSAGE, {"role": "user", "content": VERIFY_PROMPT + statement_text}]
+
+def build_verify_batch_messages(statement_texts: List[str]) -> List[Dict[str, str]]:
+    """Returns the chat messages asking the model to verify all of ``statement_texts`` at once."""
+    return [SYSTEM_MESSAGE, {"role": "user", "content": VERIFY_BATCH_PROMPT + orjson.dumps(statement_texts).decode()}]
@@ -0,0 +1,219 @@
+# The MIT License (MIT)
+# Copyright © 2023 Bittensor "Brain" Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import re
+import datetime
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+FACT_COLUMNS = ["asset", "date", "value"]
+
+# Confidence of a lookup-based result, and how far the observed value has to be
+# from the claimed one (relative) before the lookup is trusted over the LLM
+LOOKUP_CONFIDENCE = 0.95
+MIN_MARGIN = 0.01
+
+_MONTHS = [
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december"
+]
+_MONTH_RE = "|".join(_MONTHS)
+_ORDINAL = r"(?:st|nd|rd|th)?"
+_DAY_DATE_RE = re.compile(rf"\b({_MONTH_RE})\s+(\d{{1,2}}){_ORDINAL},?\s+(\d{{4}})\b", re.I)
+_DAY_FIRST_DATE_RE = re.compile(rf"\b(\d{{1,2}}){_ORDINAL}\s+(?:of\s+)?({_MONTH_RE}),?\s+(\d{{4}})\b", re.I)
+_ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_MONTH_DATE_RE = re.compile(rf"\b({_MONTH_RE})\s+(\d{{4}})\b", re.I)
+# A day number next to a month name outside a full date, e.g. "March 15" without a year
+_DAY_NEAR_MONTH_RE = re.compile(
+    rf"\b\d{{1,2}}{_ORDINAL}\s+(?:of\s+)?(?:{_MONTH_RE})\b|\b(?:{_MONTH_RE})\s+\d{{1,2}}{_ORDINAL}\b",
+    re.I
+)
+# A range of days, e.g. "15-20 March"
+_DAY_RANGE_RE = re.compile(
+    rf"(?<![\d-])\d{{1,2}}{_ORDINAL}\s*(?:[-\u2013]|to|and|through|until)\s*\d{{1,2}}{_ORDINAL}\s+(?:of\s+)?(?:{_MONTH_RE})\b",
+    re.I
+)
+_ABOVE_RE = re.compile(r"\b(?:above|over|exceed(?:ed|s)?|more than|greater than|higher than)\b", re.I)
+_BELOW_RE = re.compile(r"\b(?:below|under|less than|lower than)\b", re.I)
+_NEGATION_RE = re.compile(r"n't\b|\b(?:not|no|never|none|neither|nor|without|false|untrue|fail(?:s|ed)?|no longer)\b", re.I)
+_QUALIFIER_RE = re.compile(r"\b(?:first time|all-time|record|ever|never|again)\b", re.I)
+# Claims about every day of a range, while the lookup only checks whether any day crosses the threshold
+_UNIVERSAL_RE = re.compile(r"\b(?:throughout|every|each|all|always|whole|entire|stay(?:ed|s)?|remain(?:ed|s)?)\b", re.I)
+# Claims about a change in value, or about a metric other than the price the table holds
+_CHANGE_RE = re.compile(
+    r"\b(?:r[io]se[sn]?|gain(?:ed|s)?|gr[eo]w[sn]?|increas(?:ed|es)|jump(?:ed|s)?|climb(?:ed|s)?|"
+    r"f[ae]ll(?:s|en)?|drop(?:ped|s)?|los[te]s?|declin(?:ed|es))\s+(?:by|more than|less than)\b",
+    re.I
+)
+_METRIC_RE = re.compile(
+    r"\b(?:dominance|hash\s*rate|market\s*cap\w*|volume|supply|difficulty|fees?|share|open interest|"
+    r"transactions?|addresses|volatility|yield)\b",
+    re.I
+)
+_NUMBER_RE = re.compile(r"\$?(\d[\d,]*(?:\.\d+)?)\s*([kmb](?![a-z]))?", re.I)
+# A percentage or unit after the threshold, e.g. "10%" or "150 EH/s", means it is not a price
+_UNIT_RE = re.compile(
+    r"\s*(?:%|percent\b|per\s*cent\b|[a-z]+/[a-z]+\b|(?:[kmgtpe]?h|bps|x|times|btc|eth|sats?|gwei|points)\b)",
+    re.I
+)
+_MULTIPLIERS = {"k": 1e3, "m": 1e6, "b": 1e9}
+
+class Claim(NamedTuple):
+    """A threshold claim about an asset's value over a date range."""
+    asset: str
+    above: bool
+    threshold: float
+    start: np.datetime64  # first day, inclusive
+    end: np.datetime64  # last day, exclusive
+
+def _extract_range(text: str) -> Optional[Tuple[np.datetime64, np.datetime64]]:
+    """
+    Extracts the day or month a statement refers to, as a half-open range of days.
+    
+    Statements that mention more than one date, or a day that cannot be pinned to
+    a single month and year, have no range.
+    """
+    # Single days, "March 15, 2021", "15 March 2021" or "2021-03-15"
+    days = _DAY_DATE_RE.findall(text) + [(month, day, year) for day, month, year in _DAY_FIRST_DATE_RE.findall(text)]
+    days = [f"{int(year):04d}-{_MONTHS.index(month.lower()) + 1:02d}-{int(day):02d}" for month, day, year in days]
+    days += ["-".join(match) for match in _ISO_DATE_RE.findall(text)]
+    rest = _ISO_DATE_RE.sub(" ", _DAY_FIRST_DATE_RE.sub(" ", _DAY_DATE_RE.sub(" ", text)))
+    if len(set(days)) > 1 or _DAY_NEAR_MONTH_RE.search(rest) or _DAY_RANGE_RE.search(text):
+        return None
+    if days:
+        try:
+            start = np.datetime64(days[0], "D")
+        except ValueError:
+            return None
+        return start, start + np.timedelta64(1, "D")
+    
+    # Whole months, "March 2021"
+    months = _MONTH_DATE_RE.findall(text)
+    if len(set(months)) != 1:
+        return None
+    month, year = months[0]
+    start = np.datetime64(f"{int(year):04d}-{_MONTHS.index(month.lower()) + 1:02d}", "M")
+    return start.astype("datetime64[D]"), (start + np.timedelta64(1, "M")).astype("datetime64[D]")
+
+class FactsTable:
+    """
+    Local table of historical daily asset values, used to settle simple threshold
+    claims such as "Bitcoin reached over $60,000 in March 2021" without an LLM call.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Loads the facts table.
+        
+        Args:
+            path: Path to a Parquet file with ``asset``, ``date`` and ``value`` columns.
+        """
+        frame = pd.read_parquet(path, columns=FACT_COLUMNS, memory_map=True)
+        frame["asset"] = frame["asset"].str.lower()
+        frame = frame.sort_values(["asset", "date"])
+        
+        # Per asset, sorted days and their values, searched with np.searchsorted
+        self.series: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            asset: (
+                group["date"].to_numpy(dtype="datetime64[D]"),
+                group["value"].to_numpy(dtype=np.float64)
+            )
+            for asset, group in frame.groupby("asset", sort=False)
+        }
+        
+        # Longest names first so "bitcoin cash" wins over "bitcoin"
+        names = sorted(self.series, key=len, reverse=True)
+        self._asset_re = re.compile(r"\b(" + "|".join(map(re.escape, names)) + r")\b", re.I) if names else None
+        
+    def extract_claim(self, text: str) -> Optional[Claim]:
+        """
+        Extracts a threshold claim about a known asset from a statement.
+        
+        Args:
+            text: The text of the statement.
+            
+        Returns:
+            The claim, or None if the statement is not a simple threshold claim.
+        """
+        # Negated, universal, relative and non-price claims, and claims about records
+        # or first occurrences, are left to the LLM
+        if self._asset_re is None or any(
+            pattern.search(text) for pattern in (_NEGATION_RE, _QUALIFIER_RE, _UNIVERSAL_RE, _CHANGE_RE, _METRIC_RE)
+        ):
+            return None
+        asset = self._asset_re.search(text)
+        above = _ABOVE_RE.search(text)
+        below = _BELOW_RE.search(text)
+        if asset is None or (above is None) == (below is None):
+            return None
+        comparator = above or below
+        
+        number = _NUMBER_RE.search(text, comparator.end())
+        date_range = _extract_range(text)
+        if number is None or date_range is None or _UNIT_RE.match(text, number.end()):
+            return None
+        threshold = float(number.group(1).replace(",", ""))
+        threshold *= _MULTIPLIERS.get((number.group(2) or "").lower(), 1.0)
+        return Claim(asset.group(1).lower(), above is not None, threshold, *date_range)
+    
+    def verify(self, text: str) -> Optional[Tuple[bool, float, List[Dict[str, Any]], str, str]]:
+        """
+        Settles a statement against the table if it is a simple threshold claim.
+        
+        A claim is true if any day in its range crosses the threshold. It is only
+        declared false when every day in the range is covered by the table, and in
+        both cases the observed extreme must clear the threshold by ``MIN_MARGIN``.
+        
+        Args:
+            text: The text of the statement.
+            
+        Returns:
+            The verification result, as returned by perform_verification, or None
+            if the lookup is inconclusive.
+        """
+        claim = self.extract_claim(text)
+        if claim is None:
+            return None
+        dates, values = self.series[claim.asset]
+        lo, hi = np.searchsorted(dates, [claim.start, claim.end])
+        if lo == hi:
+            return None
+        window = values[lo:hi]
+        observed = float(window.max() if claim.above else window.min())
+        is_true = observed > claim.threshold if claim.above else observed < claim.threshold
+        
+        if abs(observed - claim.threshold) < MIN_MARGIN * abs(claim.threshold):
+            return None
+        if not is_true and hi - lo < (claim.end - claim.start).astype(int):
+            return None
+        
+        last_day = claim.end - np.timedelta64(1, "D")
+        period = str(claim.start) if last_day == claim.start else f"{claim.start} to {last_day}"
+        explanation = (
+            f"The {'highest' if claim.above else 'lowest'} recorded {claim.asset} value for {period} "
+            f"was {observed:,.2f}, which is {'above' if observed > claim.threshold else 'below'} "
+            f"the claimed {claim.threshold:,.2f}."
+        )
+        evidence = [{
+            "source": "local facts table",
+            "title": f"{claim.asset} daily values",
+            "content": explanation,
+            "url": "",
+            "retrieved_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
+        }]
+        return bool(is_true), LOOKUP_CONFIDENCE, evidence, explanation, "deterministic_lookup"
@@ -17,21 +17,23 @@
 
 import os
 import time
-import torch
+import atexit
+import signal
+import threading
+import asyncio
 import argparse
 import bittensor
 import datetime
 import traceback
-import requests
-import json
 import re
-from openai import OpenAI
-#from neurons import Config
-import Config
-import json
+import orjson
+from neurons import config as Config
+from neurons.cache import SemanticCache, DiskCache
+from neurons.batcher import VerificationBatcher
 from typing import List, Dict, Any, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
+from brain import BLOCK_TIME
 from brain.protocol import (
     Statement,
     PredictionResult,
@@ -41,6 +43,9 @@ from brain.protocol import (
     ValidationResponse
 )
 
+# Markdown code fence that LLMs often wrap their JSON output in
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*(.*?)\s*```\s*$', re.S)
+
 def blacklist_verify_statement(synapse: VerificationRequest) -> Tuple[bool, str]:
     """Determines whether a verification request should be blacklisted."""
     # Example blacklist logic
@@ -85,6 +90,9 @@ class BrainMiner:
             netuid=config.netuid
         )
         
+        # Tracking for last metagraph update block
+        self.last_update_block = int(self.metagraph.block)
+        
         # Set up axon
         self.axon = bittensor.axon(
             wallet=self.wallet,
@@ -122,16 +130,65 @@ class BrainMiner:
         # This is where you would initialize any external APIs, databases, or tools
         # that your miner will use to verify statements
         
-        # Example: Set up a web search client
-        self.search = OpenAI(api_key=Config.API_KEY, base_url=Config.BASE_URL)
+        # Shared worker threads for the batcher's LLM calls; handlers wait on the loop's default pool
+        # so that a full set of waiting requests cannot starve the calls they wait for
+        self.executor = ThreadPoolExecutor(
+            max_workers=Config.THREAD_POOL_SIZE,
+            thread_name_prefix="brain-miner"
+        )
+        atexit.register(self.executor.shutdown, wait=False, cancel_futures=True)
+        
+        # Imported here so that importing the miner does not load the LLM client's HTTP stack
+        import httpx
+        from openai import OpenAI
+        
+        # Set up the LLM client on a pooled, keep-alive HTTP connection
+        self.http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_keepalive_connections=Config.MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=Config.MAX_CONNECTIONS,
+                keepalive_expiry=Config.KEEPALIVE_EXPIRY
+            ),
+            timeout=Config.REQUEST_TIMEOUT
+        )
+        self.client = OpenAI(
+            api_key=Config.get_api_key(),
+            base_url=Config.BASE_URL,
+            http_client=self.http_client
+        )
         
-        # Example: Set up a database client for historical data
-        self.db_client = None  # Replace with actual implementation
+        # Set up a database client for historical data, used to settle simple claims without the LLM
+        self.db_client = None
+        if self.config.miner.facts_path:
+            from neurons.facts import FactsTable  # needs the optional parquet extra
+            self.db_client = FactsTable(self.config.miner.facts_path)
         
         # Example: Set up a fact-checking tool
         self.fact_checker = None  # Replace with actual implementation
         
-    def verify_statement(self, synapse: VerificationRequest) -> VerificationResponse:
+        # On-disk cache of verification results for repeated statements, kept across restarts
+        self.exact_cache = DiskCache(
+            cache_dir=self.config.miner.cache_dir,
+            ttl=self.config.miner.cache_ttl
+        ) if self.config.miner.cache_dir else None
+        
+        # Cache of verification results for repeated or paraphrased statements
+        self.cache = SemanticCache(
+            max_size=self.config.miner.cache_size,
+            ttl=self.config.miner.cache_ttl,
+            threshold=self.config.miner.cache_threshold
+        )
+        
+        # Group concurrent verifications into batched LLM calls
+        self.batcher = VerificationBatcher(
+            verify_single=self.verify_with_llm,
+            verify_batch=self.verify_batch_with_llm,
+            max_batch_size=self.config.miner.batch_size,
+            window=self.config.miner.batch_window,
+            executor=self.executor
+        )
+        
+    async def verify_statement(self, synapse: VerificationRequest) -> VerificationResponse:
         """
         Verifies a statement and determines if it's true or false with a confidence score.
         
@@ -146,14 +203,16 @@ class BrainMiner:
         try:
             # Extract the statement
             statement = synapse.statement
-            bittensor.logging.debug(f"Verifying statement: {statement.text}")
+            bittensor.logging.trace(f"Verifying statement: {statement.text}")
             
             # Perform verification logic
             # In a real implementation, this would use various tools and techniques
             # to determine the truth value of the statement
             
-            # Example verification logic (placeholder)
-            is_true, confidence, evidence, explanation, methodology = self.perform_verification(statement)
+            # Run the blocking verification off the axon's event loop
+            is_true, confidence, evidence, explanation, methodology = await asyncio.get_running_loop().run_in_executor(
+                None, self.perform_verification, statement
+            )
             
             # Create the prediction result
             result = PredictionResult(
@@ -219,30 +278,83 @@ class BrainMiner:
         
         # return is_true, confidence, evidence, explanation
 
+        # Reuse the result for a statement we have already verified, exact matches first
+        cached = self.exact_cache.get(statement.text) if self.exact_cache is not None else None
+        if cached is None:
+            cached = self.cache.get(statement.text)
+        if cached is not None:
+            return cached
+
+        # Settle simple threshold claims against the local facts table
+        result = self.db_client.verify(statement.text) if self.db_client is not None else None
+
+        # Otherwise ask the LLM, batched with any other statements verified concurrently
+        if result is None:
+            future = self.batcher.submit(statement)
+            try:
+                result = future.result(timeout=self.config.miner.verify_timeout)
+            except FutureTimeoutError:
+                # Stop the batcher from spending an LLM call on a statement nobody waits for
+                future.cancel()
+                raise
+        
+        self.cache.put(statement.text, result)
+        if self.exact_cache is not None:
+            self.exact_cache.put(statement.text, result)
+        return result
+
+    def verify_with_llm(self, statement: Statement) -> Tuple[bool, float, List[Dict[str, Any]], str, str]:
+        """
+        Verifies a single statement with one LLM call.
+        
+        Args:
+            statement: The statement to verify.
+            
+        Returns:
+            The verification result, as returned by perform_verification.
+        """
+        response = self.client.chat.completions.create(
+            model=Config.MODEL,
+            messages=Config.build_verify_messages(statement.text),
+            temperature=Config.TEMPERATURE,
+            seed=Config.SEED,
+            stream=False
+        )
+        return self.parse_result(self.parse_content(response.choices[0].message.content))
+
+    def verify_batch_with_llm(self, statements: List[Statement]) -> List[Tuple[bool, float, List[Dict[str, Any]], str, str]]:
+        """
+        Verifies several statements with a single LLM call.
+        
+        Args:
+            statements: The statements to verify.
+            
+        Returns:
+            The verification results, in the same order as the statements.
+        """
         response = self.client.chat.completions.create(
             model=Config.MODEL,
-            messages=[
-                {"role": "system", "content": Config.SYSTEM_PROMPT},
-                {"role": "user", "content": Config.VERIFY_PROMPT + statement},
-            ],
+            messages=Config.build_verify_batch_messages([statement.text for statement in statements]),
+            temperature=Config.TEMPERATURE,
+            seed=Config.SEED,
             stream=False
         )
+        return [self.parse_result(res) for res in self.parse_content(response.choices[0].message.content)]
 
-        bittensor.logging.debug(response.choices[0].message.content)
-        raw_content = response.choices[0].message.content.strip()
-        if raw_content.startswith("```json"):
-            raw_content = raw_content.removeprefix("```json").strip()
-        if raw_content.endswith("```"):
-            raw_content = raw_content.removesuffix("```").strip()
-        res = json.loads(raw_content)
+    @staticmethod
+    def parse_content(content: str) -> Any:
+        """Parses the JSON payload of an LLM response, stripping any markdown code fence."""
+        match = _FENCE_RE.match(content)
+        return orjson.loads(match.group(1) if match else content)
 
+    @staticmethod
+    def parse_result(res: Dict[str, Any]) -> Tuple[bool, float, List[Dict[str, Any]], str, str]:
+        """Converts one parsed LLM output object into a verification result."""
         is_true = res['is_true']
         confidence = res['confidence']
         evidence = res['evidence']
-        # explanation = res['explanation']
-        # methodology = res['methodology']
-        explanation= 'empirical observation, logical reasoning, mathematical proof, experimentation, cross-referencing reliable sources, expert testimony, statistical analysis, historical validation, falsifiability testing, and consistency checking within known frameworks or systems, Bayesian inference, peer review, case study analysis, content analysis, analogical reasoning, simulation modeling, forensic investigation, root cause analysis, triangulation, deduction and induction, legal precedent evaluation, field testing, axiomatic validation, comparative analysis, and heuristic checks.'
-        methodology = 'empirical observation, logical reasoning, mathematical proof, experimentation, cross-referencing reliable sources, expert testimony, statistical analysis, historical validation, falsifiability testing, and consistency checking within known frameworks or systems, Bayesian inference, peer review, case study analysis, content analysis, analogical reasoning, simulation modeling, forensic investigation, root cause analysis, triangulation, deduction and induction, legal precedent evaluation, field testing, axiomatic validation, comparative analysis, and heuristic checks.'
+        explanation = res.get('explanation') or Config.DEFAULT_METHODOLOGY
+        methodology = res.get('methodology') or Config.DEFAULT_METHODOLOGY
         return is_true, confidence, evidence, explanation, methodology
 
     
@@ -259,6 +371,9 @@ class BrainMiner:
         # This is a placeholder implementation
         # In a real miner, this would use search engines, databases, etc.
         
+        # All evidence from one search shares a single UTC retrieval timestamp
+        retrieved_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        
         # Example evidence
         evidence = [
             {
@@ -266,7 +381,7 @@ class BrainMiner:
                 "title": "Example Evidence",
                 "content": "This is example evidence content.",
                 "url": "https://example.com/evidence",
-                "retrieved_at": datetime.datetime.now().isoformat()
+                "retrieved_at": retrieved_at
             }
         ]
         
@@ -296,7 +411,7 @@ class BrainMiner:
         
         return is_true, confidence, explanation
     
-    def validate_verification(self, synapse: ValidationRequest) -> ValidationResponse:
+    async def validate_verification(self, synapse: ValidationRequest) -> ValidationResponse:
         """
         Validates another miner's verification result.
         
@@ -311,10 +426,12 @@ class BrainMiner:
             statement = synapse.statement
             miner_result = synapse.miner_result
             
-            bittensor.logging.debug(f"Validating verification for statement: {statement.text}")
+            bittensor.logging.trace(f"Validating verification for statement: {statement.text}")
             
-            # Perform our own verification
-            is_true, confidence, evidence, explanation, methodology = self.perform_verification(statement)
+            # Perform our own verification, off the axon's event loop
+            is_true, confidence, evidence, explanation, methodology = await asyncio.get_running_loop().run_in_executor(
+                None, self.perform_verification, statement
+            )
             
             # Compare our result with the miner's result
             is_valid = abs(confidence - miner_result.confidence) < 0.3 and is_true == miner_result.is_true
@@ -374,6 +491,14 @@ class BrainMiner:
         parser.add_argument('--netuid', type=int, default=1, help='The chain subnet UID')
         parser.add_argument('--miner.name', type=str, default="brain_miner", help='Name of the miner')
         parser.add_argument('--miner.verify_timeout', type=float, default=60.0, help='Timeout for verification in seconds')
+        parser.add_argument('--miner.cache_size', type=int, default=1024, help='Maximum number of cached verification results')
+        parser.add_argument('--miner.cache_ttl', type=float, default=3600.0, help='Time in seconds a cached verification result stays valid')
+        parser.add_argument('--miner.cache_dir', type=str, default=None, help='Directory of an on-disk cache of exact verification results')
+        parser.add_argument('--miner.cache_threshold', type=float, default=0.95, help='Minimum similarity for a statement to hit the cache')
+        parser.add_argument('--miner.batch_size', type=int, default=16, help='Maximum number of statements verified in one LLM call')
+        parser.add_argument('--miner.batch_window', type=float, default=0.05, help='Time in seconds to wait for more statements to batch together')
+        parser.add_argument('--miner.facts_path', type=str, default=None, help='Parquet file of historical daily asset values (asset, date, value) used before asking the LLM')
+        parser.add_argument('--miner.metagraph_update_interval', type=int, default=100, help='Interval in blocks to update the metagraph')
         
         # Parse the config
         config = bittensor.config(parser)
@@ -388,29 +513,35 @@ def main():
     # Create and start the miner
     miner = BrainMiner(config)
     
-    # Keep the miner running
-    while True:
+    # Stop promptly on a shutdown signal instead of finishing a sleep
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda signum, frame: stop.set())
+    
+    # Keep the miner running, checking the chain once per block
+    deadline = time.monotonic()
+    while not stop.is_set():
         try:
-            # Update the metagraph with the latest network state
-            miner.metagraph = miner.subtensor.metagraph(
-                netuid=miner.config.netuid
-            )
-            
             # Log the current block
             current_block = miner.subtensor.get_current_block()
             bittensor.logging.debug(f"Current block: {current_block}")
             
-            # Sleep for a bit
-            time.sleep(60)
-            
-        except KeyboardInterrupt:
-            bittensor.logging.warning("Keyboard interrupt detected, exiting")
-            break
+            # Update the metagraph with the latest network state if needed
+            if current_block - miner.last_update_block >= miner.config.miner.metagraph_update_interval:
+                miner.metagraph = miner.subtensor.metagraph(
+                    netuid=miner.config.netuid
+                )
+                miner.last_update_block = current_block
             
         except Exception as e:
             bittensor.logging.error(f"Error in main loop: {str(e)}")
             bittensor.logging.error(traceback.format_exc())
-            time.sleep(60)
+        
+        # Wait for the next block, measured from when the last check was due so checks do not drift
+        deadline = max(deadline + BLOCK_TIME, time.monotonic())
+        stop.wait(deadline - time.monotonic())
+    
+    bittensor.logging.warning("Shutdown signal received, exiting")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,141 @@
+# The MIT License (MIT)
+# Copyright © 2023 Bittensor "Brain" Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import datetime
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from typing import Any, Dict, List, Optional
+
+from brain.protocol import Statement
+
+STATEMENT_COLUMNS = ["id", "text", "timestamp"]
+GROUND_TRUTH_COLUMNS = ["id", "is_true", "source"]
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+def read_table(path: str, columns: List[str]) -> pa.Table:
+    """
+    Reads the given columns of an Arrow IPC or Parquet file into an Arrow table.
+    
+    Arrow IPC files (``.arrow``, ``.feather``, ``.ipc``) are memory-mapped without
+    copying, so rows are only paged in when they are accessed. Parquet files are
+    read through a memory map too, but their pages are decoded into Arrow buffers
+    on load. In both cases no Python object is created per row.
+    
+    Args:
+        path: Path to the file.
+        columns: Names of the columns to read.
+        
+    Returns:
+        The table, with the ``id`` column cast to strings.
+    """
+    if path.endswith(ARROW_SUFFIXES):
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all().select(columns)
+    else:
+        table = pq.read_table(path, columns=columns, memory_map=True)
+    if not pa.types.is_string(table.schema.field("id").type):
+        table = table.set_column(table.schema.get_field_index("id"), "id", pc.cast(table["id"], pa.string()))
+    return table
+
+def to_iso(value: Any) -> str:
+    """Formats a timestamp read from a table as an ISO 8601 string, naive datetimes taken as UTC."""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return value.astimezone(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+class StatementTable:
+    """
+    Read-only sequence of statements backed by an Arrow IPC or Parquet file.
+    
+    The table is kept column-wise in Arrow buffers; a ``Statement`` is only
+    built when a row is accessed, so loading a large table does not allocate
+    one Python object per statement.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Loads the statements table.
+        
+        Args:
+            path: Path to a file with ``id``, ``text`` and ``timestamp`` columns.
+        """
+        self.table = read_table(path, STATEMENT_COLUMNS)
+        
+    def __len__(self) -> int:
+        return self.table.num_rows
+    
+    def __getitem__(self, idx: int) -> Statement:
+        """
+        Builds the statement stored at row ``idx``.
+        
+        Args:
+            idx: Row index of the statement.
+            
+        Returns:
+            The statement.
+        """
+        if not -len(self) <= idx < len(self):
+            raise IndexError(f"Statement index {idx} out of range")
+        row = self.table.slice(idx % len(self), 1).to_pylist()[0]
+        return Statement(
+            id=row["id"],
+            text=row["text"],
+            timestamp=to_iso(row["timestamp"])
+        )
+
+class GroundTruthTable:
+    """
+    Read-only mapping of statement IDs to ground truth, backed by an Arrow IPC or Parquet file.
+    
+    Mirrors the ``dict.get`` interface of the in-memory ground truth database.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Loads the ground truth table.
+        
+        Args:
+            path: Path to a file with ``id``, ``is_true`` and ``source`` columns.
+        """
+        self.table = read_table(path, GROUND_TRUTH_COLUMNS)
+        
+    def __len__(self) -> int:
+        return self.table.num_rows
+    
+    def get(self, statement_id: str, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Looks up the ground truth of a statement with a vectorized scan of the ``id`` column.
+        
+        Args:
+            statement_id: ID of the statement.
+            default: Value returned when the statement has no ground truth.
+            
+        Returns:
+            Dictionary with ``is_true`` and ``source`` keys, or ``default``.
+        """
+        row = pc.index(self.table["id"], str(statement_id)).as_py()
+        if row < 0:
+            return default
+        record = self.table.slice(row, 1).to_pylist()[0]
+        return {
+            "is_true": bool(record["is_true"]),
+            "source": record["source"]
+        }
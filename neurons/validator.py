@@ -16,17 +16,20 @@
 # DEALINGS IN THE SOFTWARE.
 
 import os
+
+# The validator's tensors are metagraph-sized, so keep torch from starting a thread per core on import
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 import time
 import torch
+import signal
+import asyncio
 import argparse
 import bittensor
 import datetime
 import traceback
-import json
-import random
-import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Sequence, Mapping
 from concurrent.futures import ThreadPoolExecutor
 
 from brain.protocol import (
@@ -37,9 +40,67 @@ from brain.protocol import (
     ValidationRequest,
     ValidationResponse
 )
-from brain.forward import get_verification_responses
+from brain import BLOCK_TIME
+from brain.forward import forward_verification_responses, ensure_session, serving_uids
 from brain.reward import calculate_verification_reward, calculate_validation_reward
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to torch
+    njit = None
+
+# Number of most recent rewards averaged per miner when setting weights
+REWARD_WINDOW = 10
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _weights_kernel(recent_rewards, reward_counts, window, out):
+        """
+        Average of each UID's recent rewards, in a single fused loop.
+        """
+        for uid in range(recent_rewards.shape[0]):
+            count = min(max(reward_counts[uid], 1), window)
+            out[uid] = recent_rewards[uid].sum() / count
+else:
+    _weights_kernel = None
+
+def compute_weights(recent_rewards: torch.Tensor, reward_counts: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Computes miner weights as the normalized average of each UID's recent rewards.
+    
+    Written without data-dependent branches so that it can be compiled with ``torch.compile``.
+    
+    Args:
+        recent_rewards: Ring buffer of recent rewards, one row per UID.
+        reward_counts: Number of rewards recorded for each UID.
+        
+    Returns:
+        The normalized weights and the same weights scaled to uint16 range.
+    """
+    weights = recent_rewards.sum(dim=1) / reward_counts.clamp(min=1, max=REWARD_WINDOW)
+    total = weights.sum()
+    weights = weights / torch.where(total > 0, total, torch.ones_like(total))
+    return weights, (weights * 65535).to(torch.int64)
+
+def compute_weights_jit(recent_rewards: torch.Tensor, reward_counts: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Same as ``compute_weights``, with the per-UID averages computed by the numba kernel.
+    
+    Args:
+        recent_rewards: Ring buffer of recent rewards, one row per UID.
+        reward_counts: Number of rewards recorded for each UID.
+        
+    Returns:
+        The normalized weights and the same weights scaled to uint16 range.
+    """
+    averages = np.empty(recent_rewards.shape[0], dtype=np.float32)
+    _weights_kernel(recent_rewards.numpy(), reward_counts.numpy(), REWARD_WINDOW, averages)
+    total = averages.sum()
+    if total > 0:
+        averages /= total
+    weights = torch.from_numpy(averages)
+    return weights, (weights * 65535).to(torch.int64)
+
 class BrainValidator:
     """
     Implementation of the Brain subnet validator that evaluates miners' verification of prediction market statements.
@@ -79,8 +140,23 @@ class BrainValidator:
         # Set up ground truth database if available
         self.ground_truth_db = self.load_ground_truth()
         
-        # Set up rewards history
-        self.rewards_history = {}
+        # Set up statement sampling state: block each statement was last verified at,
+        # and how much miners disagreed on it (unseen statements count as contested)
+        self.statement_last_seen = np.zeros(len(self.statements_db), dtype=np.int64)
+        self.statement_disagreement = np.ones(len(self.statements_db), dtype=np.float64)
+        
+        # Set up rewards history, a ring buffer of the most recent rewards per UID
+        self.recent_rewards = torch.zeros(len(self.metagraph.uids), REWARD_WINDOW)
+        self.reward_counts = torch.zeros(len(self.metagraph.uids), dtype=torch.long)
+        
+        # Set up weight computation, compiled if possible and warmed up so the first epoch does not pay for it
+        if self.config.validator.compile:
+            self.compute_weights = torch.compile(compute_weights, mode="reduce-overhead")
+        elif _weights_kernel is not None:
+            self.compute_weights = compute_weights_jit
+        else:
+            self.compute_weights = compute_weights
+        self.compute_weights(self.recent_rewards, self.reward_counts)
         
         # Tracking for last update block
         self.last_update_block = 0
@@ -90,13 +166,18 @@ class BrainValidator:
         
         self.logger.info("Brain validator initialized")
         
-    def load_statements(self) -> List[Statement]:
+    def load_statements(self) -> Sequence[Statement]:
         """
         Load statements from a database or file.
         
         Returns:
-            List of statements to verify.
+            Sequence of statements to verify.
         """
+        # Memory-map the statements table if one was given
+        if self.config.validator.statements_path:
+            from neurons.statements import StatementTable  # needs the optional parquet extra
+            return StatementTable(self.config.validator.statements_path)
+        
         # This is a placeholder implementation
         # In a real validator, this would load from a database or file
         
@@ -121,13 +202,18 @@ class BrainValidator:
         
         return statements
     
-    def load_ground_truth(self) -> Dict[str, Any]:
+    def load_ground_truth(self) -> Mapping[str, Any]:
         """
         Load ground truth data for statements if available.
         
         Returns:
-            Dictionary mapping statement IDs to ground truth data.
+            Mapping of statement IDs to ground truth data.
         """
+        # Memory-map the ground truth table if one was given
+        if self.config.validator.ground_truth_path:
+            from neurons.statements import GroundTruthTable  # needs the optional parquet extra
+            return GroundTruthTable(self.config.validator.ground_truth_path)
+        
         # This is a placeholder implementation
         # In a real validator, this would load from a database or file
         
@@ -149,16 +235,40 @@ class BrainValidator:
         
         return ground_truth
     
-    def get_random_statement(self) -> Statement:
+    def get_random_statement(self, current_block: int) -> Tuple[int, Statement]:
         """
-        Get a random statement from the database.
+        Get a random statement from the database, favouring statements that have not
+        been verified for a long time and statements miners disagree on.
         
+        Args:
+            current_block: The current block number.
+            
         Returns:
-            A randomly selected statement.
+            The index of the selected statement and the statement itself.
+        """
+        # Weight by the number of blocks since the last verification, doubled at most for disagreement
+        age = np.maximum(current_block - self.statement_last_seen, 1)
+        weights = age * (1.0 + self.statement_disagreement)
+        idx = int(np.random.choice(len(weights), p=weights / weights.sum()))
+        return idx, self.statements_db[idx]
+    
+    def update_statement_stats(self, idx: int, current_block: int, responses: List[VerificationResponse]):
+        """
+        Records that a statement was verified and how much the miners disagreed on it.
+        
+        Args:
+            idx: Index of the verified statement.
+            current_block: The current block number.
+            responses: Verification responses received for the statement.
         """
-        return random.choice(self.statements_db)
+        is_true = np.fromiter((r.result.is_true for r in responses), dtype=bool, count=len(responses))
+        share = is_true.mean()
+        
+        # 0 when all miners agree, 1 when they are split evenly
+        self.statement_last_seen[idx] = current_block
+        self.statement_disagreement[idx] = 4.0 * share * (1.0 - share)
     
-    def run_step(self):
+    async def run_step(self):
         """Run a single step of the validator."""
         try:
             # Get the current block
@@ -171,6 +281,7 @@ class BrainValidator:
                     netuid=self.config.netuid
                 )
                 self.last_update_block = current_block
+                self.resize_rewards(len(self.metagraph.uids))
                 self.logger.info(f"Updated metagraph: {len(self.metagraph.axons)} axons found")
             
             # Check if we need to set weights
@@ -180,15 +291,18 @@ class BrainValidator:
                 self.last_epoch = current_epoch
             
             # Select a statement to verify
-            statement = self.get_random_statement()
+            statement_idx, statement = self.get_random_statement(current_block)
             self.logger.info(f"Selected statement: {statement.text}")
             
             # Get verification responses from miners
-            responses, times, uids = get_verification_responses(
+            responses, times, uids = await forward_verification_responses(
                 metagraph=self.metagraph,
                 dendrite=self.dendrite,
                 statement=statement,
-                timeout=self.config.validator.verification_timeout
+                timeout=self.config.validator.verification_timeout,
+                batch_size=self.config.validator.batch_size,
+                max_concurrency=self.config.validator.max_concurrency,
+                hedge=self.config.validator.hedge
             )
             
             self.logger.info(f"Received {len(responses)} verification responses")
@@ -197,22 +311,22 @@ class BrainValidator:
                 self.logger.warning("No responses received, skipping step")
                 return
             
+            # Record when the statement was verified and how contested it is
+            self.update_statement_stats(statement_idx, current_block, responses)
+            
             # Calculate rewards for verification responses
             ground_truth = self.ground_truth_db.get(statement.id)
             verification_rewards = calculate_verification_reward(responses, ground_truth)
             
             # Log the rewards
-            for i, (uid, reward) in enumerate(zip(uids, verification_rewards)):
-                self.logger.info(f"Miner {uid} verification reward: {reward.item():.4f}")
+            self.log_rewards("verification", uids, verification_rewards)
                 
-                # Update rewards history
-                if uid not in self.rewards_history:
-                    self.rewards_history[uid] = []
-                self.rewards_history[uid].append((current_block, reward.item()))
+            # Update rewards history
+            self.record_rewards(uids, verification_rewards)
             
             # Optionally, get validation responses from miners
             if self.config.validator.run_validation:
-                validation_responses = self.get_validation_responses(statement, responses[0], uids)
+                validation_responses = await self.get_validation_responses(statement, responses[0], uids)
                 
                 if len(validation_responses) > 0:
                     # Calculate rewards for validation responses
@@ -223,19 +337,16 @@ class BrainValidator:
                     )
                     
                     # Log the validation rewards
-                    for i, (uid, reward) in enumerate(zip(uids, validation_rewards)):
-                        self.logger.info(f"Miner {uid} validation reward: {reward.item():.4f}")
+                    self.log_rewards("validation", uids, validation_rewards)
                         
-                        # Update rewards history
-                        if uid not in self.rewards_history:
-                            self.rewards_history[uid] = []
-                        self.rewards_history[uid].append((current_block, reward.item()))
+                    # Update rewards history
+                    self.record_rewards(uids, validation_rewards)
             
         except Exception as e:
             self.logger.error(f"Error in run_step: {str(e)}")
             self.logger.error(traceback.format_exc())
     
-    def get_validation_responses(
+    async def get_validation_responses(
         self,
         statement: Statement,
         verification_response: VerificationResponse,
@@ -253,10 +364,8 @@ class BrainValidator:
             List of validation responses.
         """
         # Get UIDs of miners that are serving the network
-        serving_axons = [
-            uid for uid, axon in enumerate(self.metagraph.axons) 
-            if axon.is_serving and uid not in exclude_uids
-        ]
+        uids = serving_uids(self.metagraph)
+        uids = uids[~np.isin(uids, exclude_uids)]
         
         # Create the validation request
         request = ValidationRequest(
@@ -264,9 +373,10 @@ class BrainValidator:
             miner_result=verification_response.result
         )
         
-        # Get responses from the network
-        responses = self.dendrite.query(
-            axons=[self.metagraph.axons[uid] for uid in serving_axons],
+        # Get responses from the network, all axons queried concurrently
+        await ensure_session(self.dendrite)
+        responses = await self.dendrite.forward(
+            axons=[self.metagraph.axons[uid] for uid in uids],
             synapse=request,
             deserialize=True,
             timeout=self.config.validator.validation_timeout
@@ -281,34 +391,62 @@ class BrainValidator:
         
         return successful_responses
     
-    def set_weights(self):
-        """Set weights for the miners based on their performance."""
-        # Initialize weights
-        weights = torch.zeros(len(self.metagraph.uids))
+    def log_rewards(self, kind: str, uids: List[int], rewards: torch.FloatTensor):
+        """
+        Logs a summary of a step's rewards, with the per-miner rewards at debug level.
         
-        # Calculate weights based on rewards history
-        for uid in self.rewards_history:
-            # Get recent rewards (last 10 blocks)
-            recent_rewards = [reward for block, reward in self.rewards_history[uid][-10:]]
-            
-            if len(recent_rewards) > 0:
-                # Calculate average reward
-                avg_reward = sum(recent_rewards) / len(recent_rewards)
-                
-                # Set weight based on average reward
-                weights[uid] = avg_reward
+        Args:
+            kind: Kind of reward, "verification" or "validation".
+            uids: UIDs of the miners that were rewarded.
+            rewards: Tensor of rewards, one per UID.
+        """
+        values = rewards.tolist()
+        if not values:
+            return
+        self.logger.info(
+            f"{len(values)} {kind} rewards: mean {sum(values) / len(values):.4f}, "
+            f"min {min(values):.4f}, max {max(values):.4f}"
+        )
+        self.logger.debug(f"Miner {kind} rewards: " + ", ".join(f"{uid}={value:.4f}" for uid, value in zip(uids, values)))
+    
+    def record_rewards(self, uids: List[int], rewards: torch.FloatTensor):
+        """
+        Appends rewards to the ring buffer of each UID.
+        
+        Args:
+            uids: UIDs of the miners that were rewarded.
+            rewards: Tensor of rewards, one per UID.
+        """
+        n = min(len(uids), len(rewards))
+        if n == 0:
+            return
+        uids = torch.as_tensor(uids[:n], dtype=torch.long)
+        slots = self.reward_counts[uids] % REWARD_WINDOW
+        self.recent_rewards[uids, slots] = rewards[:n].to(self.recent_rewards.dtype)
+        self.reward_counts[uids] += 1
+    
+    def resize_rewards(self, n: int):
+        """
+        Resizes the rewards history to ``n`` UIDs, keeping the history of existing UIDs.
         
-        # Normalize weights
-        if weights.sum() > 0:
-            weights = weights / weights.sum()
+        Args:
+            n: Number of UIDs in the metagraph.
+        """
+        current = self.recent_rewards.shape[0]
+        if n > current:
+            self.recent_rewards = torch.cat([self.recent_rewards, torch.zeros(n - current, REWARD_WINDOW)])
+            self.reward_counts = torch.cat([self.reward_counts, torch.zeros(n - current, dtype=torch.long)])
+        elif n < current:
+            self.recent_rewards = self.recent_rewards[:n].clone()
+            self.reward_counts = self.reward_counts[:n].clone()
+    
+    def set_weights(self):
+        """Set weights for the miners based on their performance."""
+        # Calculate normalized weights and their uint16 form expected by subtensor
+        weights, uint_weights = self.compute_weights(self.recent_rewards, self.reward_counts)
         
         # Set weights on the network
         try:
-            # Convert weights to uint16 format expected by subtensor
-            uint_weights = torch.zeros(len(self.metagraph.uids), dtype=torch.int64)
-            for uid, weight in enumerate(weights):
-                uint_weights[uid] = int(weight * 65535)
-            
             # Set weights
             self.subtensor.set_weights(
                 netuid=self.config.netuid,
@@ -342,16 +480,50 @@ class BrainValidator:
         parser.add_argument('--netuid', type=int, default=1, help='The chain subnet UID')
         parser.add_argument('--validator.name', type=str, default="brain_validator", help='Name of the validator')
         parser.add_argument('--validator.verification_timeout', type=float, default=30.0, help='Timeout for verification requests in seconds')
+        parser.add_argument('--validator.statements_path', type=str, default=None, help='Parquet or Arrow IPC file of statements to verify (id, text, timestamp)')
+        parser.add_argument('--validator.ground_truth_path', type=str, default=None, help='Parquet or Arrow IPC file of ground truth for statements (id, is_true, source)')
         parser.add_argument('--validator.validation_timeout', type=float, default=30.0, help='Timeout for validation requests in seconds')
         parser.add_argument('--validator.run_validation', action='store_true', help='Whether to run validation requests')
         parser.add_argument('--validator.metagraph_update_interval', type=int, default=100, help='Interval in blocks to update the metagraph')
+        parser.add_argument('--validator.step_blocks', type=int, default=5, help='Interval in blocks between validator steps')
         parser.add_argument('--validator.epoch_length', type=int, default=100, help='Length of an epoch in blocks')
+        parser.add_argument('--validator.batch_size', type=int, default=32, help='Number of axons per query batch')
+        parser.add_argument('--validator.max_concurrency', type=int, default=8, help='Maximum number of query batches in flight at once')
+        parser.add_argument('--validator.hedge', action='store_true', help='Whether to send hedged duplicate requests to slow miners')
+        parser.add_argument('--validator.compile', action='store_true', help='Compile the weight computation with torch.compile (requires torch>=2.0)')
         
         # Parse the config
         config = bittensor.config(parser)
         
         return config
 
+async def run(validator: BrainValidator):
+    """Keep the validator running on a single event loop, one step every few blocks, until a shutdown signal."""
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    
+    interval = validator.config.validator.step_blocks * BLOCK_TIME
+    deadline = time.monotonic()
+    while not stop.is_set():
+        try:
+            # Run a step
+            await validator.run_step()
+            
+        except Exception as e:
+            validator.logger.error(f"Error in main loop: {str(e)}")
+            validator.logger.error(traceback.format_exc())
+        
+        # Wait until the next step is due, measured from when the last one was due so steps do not drift
+        deadline = max(deadline + interval, time.monotonic())
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=deadline - time.monotonic())
+        except asyncio.TimeoutError:
+            pass
+    
+    validator.logger.info("Shutdown signal received, exiting")
+
 def main():
     """Main function to run the validator."""
     # Get the config
@@ -361,22 +533,7 @@ def main():
     validator = BrainValidator(config)
     
     # Keep the validator running
-    while True:
-        try:
-            # Run a step
-            validator.run_step()
-            
-            # Sleep for a bit
-            time.sleep(60)
-            
-        except KeyboardInterrupt:
-            validator.logger.info("Keyboard interrupt detected, exiting")
-            break
-            
-        except Exception as e:
-            validator.logger.error(f"Error in main loop: {str(e)}")
-            validator.logger.error(traceback.format_exc())
-            time.sleep(60)
+    asyncio.run(run(validator))
 
 if __name__ == "__main__":
     main()
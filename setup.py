@@ -16,59 +16,9 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import os
-import re
-import codecs
-import pathlib
-from os.path import dirname, abspath
-from setuptools import setup, find_packages
+# All package metadata lives in pyproject.toml. This stub only keeps
+# legacy `python setup.py ...` invocations and old pip versions working.
 
-here = os.path.abspath(os.path.dirname(__file__))
+from setuptools import setup
 
-def read(*parts):
-    with codecs.open(os.path.join(here, *parts), 'r') as fp:
-        return fp.read()
-
-def find_version(*file_paths):
-    version_file = read(*file_paths)
-    version_match = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", version_file, re.M)
-    if version_match:
-        return version_match.group(1)
-    raise RuntimeError("Unable to find version string.")
-
-setup(
-    name="bittensor-brain-subnet",
-    version=find_version("brain", "__init__.py"),
-    description="Bittensor Brain Subnet for Prediction Market Verification",
-    long_description=read("README.md"),
-    long_description_content_type="text/markdown",
-    author="Bittensor Brain Subnet Team",
-    packages=find_packages(),
-    include_package_data=True,
-    install_requires=[
-        "bittensor>=6.0.0",
-        "pandas>=1.3.0",
-        "numpy>=1.20.0",
-        "pydantic>=1.8.2",
-        "requests>=2.25.1",
-        "torch>=1.10.0",
-    ],
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: Developers",
-        "Topic :: Software Development :: Build Tools",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3 :: Only",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Topic :: Scientific/Engineering",
-        "Topic :: Scientific/Engineering :: Artificial Intelligence",
-    ],
-    entry_points={
-        "console_scripts": [
-            "brain-miner=neurons.miner:main",
-            "brain-validator=neurons.validator:main",
-        ],
-    },
-)
+setup()
@@ -0,0 +1,84 @@
+# The MIT License (MIT)
+# Copyright © 2023 Bittensor "Brain" Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+pytest.importorskip("bittensor")
+
+from brain.protocol import Statement
+from neurons.batcher import VerificationBatcher
+
+def make_statement(i: int) -> Statement:
+    return Statement(id=str(i), text=f"Statement {i}", timestamp="2021-03-01T00:00:00Z")
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield executor
+    executor.shutdown(wait=True)
+
+def test_concurrent_statements_share_one_batch(executor):
+    batches = []
+    
+    def verify_batch(statements):
+        batches.append(len(statements))
+        return [statement.id for statement in statements]
+    
+    batcher = VerificationBatcher(lambda s: pytest.fail("single call"), verify_batch, window=0.5, executor=executor)
+    futures = [batcher.submit(make_statement(i)) for i in range(3)]
+    assert [future.result(timeout=5) for future in futures] == ["0", "1", "2"]
+    assert batches == [3]
+
+@pytest.mark.parametrize("verify_batch", [
+    lambda statements: 1 / 0,
+    lambda statements: ["only one"],
+])
+def test_failed_batch_falls_back_to_single_calls(executor, verify_batch):
+    batcher = VerificationBatcher(lambda s: s.id, verify_batch, window=0.5, executor=executor)
+    futures = [batcher.submit(make_statement(i)) for i in range(3)]
+    assert [future.result(timeout=5) for future in futures] == ["0", "1", "2"]
+
+def test_single_call_errors_reach_the_caller(executor):
+    def verify_single(statement):
+        raise RuntimeError("llm down")
+    
+    batcher = VerificationBatcher(verify_single, lambda s: [], window=0.01, executor=executor)
+    with pytest.raises(RuntimeError, match="llm down"):
+        batcher.submit(make_statement(0)).result(timeout=5)
+
+def test_batches_are_dispatched_concurrently(executor):
+    # Both calls must be in flight at once to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    
+    def verify_single(statement):
+        barrier.wait()
+        return statement.id
+    
+    batcher = VerificationBatcher(verify_single, lambda s: [], max_batch_size=1, window=0.01, executor=executor)
+    futures = [batcher.submit(make_statement(i)) for i in range(2)]
+    assert [future.result(timeout=5) for future in futures] == ["0", "1"]
+
+def test_cancelled_statements_are_skipped(executor):
+    calls = []
+    batcher = VerificationBatcher(calls.append, lambda s: [], window=0.2, executor=executor)
+    future = batcher.submit(make_statement(0))
+    assert future.cancel()
+    done = batcher.submit(make_statement(1))
+    done.result(timeout=5)
+    assert [statement.id for statement in calls] == ["1"]
@@ -0,0 +1,76 @@
+# The MIT License (MIT)
+# Copyright © 2023 Bittensor "Brain" Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import time
+import pytest
+
+from neurons.cache import fingerprint, DiskCache, SemanticCache
+
+RESULT = (True, 0.9, [], "explanation", "methodology")
+
+@pytest.mark.parametrize("cached, lookup", [
+    ("Bitcoin closed below 30,000 points on March 1, 2021.", "Bitcoin closed above 30,000 points on March 1, 2021."),
+    ("Bitcoin closed above 30,000 points on March 1, 2021.", "Ethereum closed above 30,000 points on March 1, 2021."),
+    ("Bitcoin closed above 30,000 points on March 1, 2021.", "Bitcoin did not close above 30,000 points on March 1, 2021."),
+    ("Bitcoin closed above 30,000 points on March 1, 2021.", "Bitcoin closed at least 30,000 points on March 1, 2021."),
+    ("Bitcoin closed above $60k on March 1, 2021.", "Bitcoin closed above $70k on March 1, 2021."),
+    ("The Lakers beat the Celtics in Game 7 of the 2024 NBA Finals.", "The Celtics beat the Lakers in Game 7 of the 2024 NBA Finals."),
+    ("Bitcoin closed higher than Ethereum on 2021-03-05.", "Ethereum closed higher than Bitcoin on 2021-03-05."),
+])
+def test_semantic_cache_misses_near_miss_statements(cached, lookup):
+    cache = SemanticCache(max_size=4)
+    cache.put(cached, RESULT)
+    assert cache.get(lookup) is None
+    assert fingerprint(cached) != fingerprint(lookup)
+
+def test_semantic_cache_hits_rewording():
+    cache = SemanticCache(max_size=4)
+    cache.put("Bitcoin reached a price of over $60,000 in March 2021.", RESULT)
+    assert cache.get("Bitcoin reached a price of over 60k in March 2021") == RESULT
+
+def test_semantic_cache_evicts_least_recently_used():
+    cache = SemanticCache(max_size=2)
+    cache.put("Bitcoin closed above 10 in May 2021.", 1)
+    cache.put("Bitcoin closed above 20 in May 2021.", 2)
+    assert cache.get("Bitcoin closed above 10 in May 2021.") == 1
+    cache.put("Bitcoin closed above 30 in May 2021.", 3)
+    assert len(cache) == 2
+    assert cache.get("Bitcoin closed above 20 in May 2021.") is None
+    assert cache.get("Bitcoin closed above 10 in May 2021.") == 1
+
+def test_semantic_cache_expires_entries():
+    cache = SemanticCache(max_size=2, ttl=-1.0)
+    cache.put("Bitcoin closed above 10 in May 2021.", 1)
+    assert cache.get("Bitcoin closed above 10 in May 2021.") is None
+    assert len(cache) == 0
+
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    assert cache.get("Bitcoin closed above 10 in May 2021.") is None
+    cache.put("Bitcoin closed above 10 in May 2021.", RESULT)
+    assert cache.get("Bitcoin closed above 10 in May 2021.") == list(RESULT)
+    assert cache.get("Bitcoin closed above 20 in May 2021.") is None
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+def test_disk_cache_expires_entries(tmp_path):
+    cache = DiskCache(str(tmp_path), ttl=60.0)
+    cache.put("Bitcoin closed above 10 in May 2021.", RESULT)
+    path = cache._path("Bitcoin closed above 10 in May 2021.")
+    stale = time.time() - 120.0
+    os.utime(path, (stale, stale))
+    assert cache.get("Bitcoin closed above 10 in May 2021.") is None
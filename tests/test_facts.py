@@ -0,0 +1,114 @@
+# The MIT License (MIT)
+# Copyright © 2023 Bittensor "Brain" Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from neurons.facts import FactsTable
+
+@pytest.fixture
+def facts(tmp_path):
+    path = tmp_path / "facts.parquet"
+    march = pd.date_range("2021-03-01", "2021-03-31")
+    pd.DataFrame({
+        "asset": ["Bitcoin"] * len(march),
+        "date": march,
+        "value": [50000.0 + 500.0 * i for i in range(len(march))],
+    }).to_parquet(path)
+    return FactsTable(str(path))
+
+def test_extract_claim_day_and_month(facts):
+    claim = facts.extract_claim("Bitcoin closed above $55k on March 3, 2021.")
+    assert (claim.asset, claim.above, claim.threshold) == ("bitcoin", True, 55000.0)
+    assert str(claim.start) == "2021-03-03" and str(claim.end) == "2021-03-04"
+    
+    claim = facts.extract_claim("Bitcoin fell below 45,000 in March 2021.")
+    assert (claim.above, claim.threshold) == (False, 45000.0)
+    assert str(claim.start) == "2021-03-01" and str(claim.end) == "2021-04-01"
+
+def test_extract_claim_day_first_dates(facts):
+    for text in ("Bitcoin closed above $60,000 on 15 March 2021.", "Bitcoin closed above $60,000 on the 15th of March, 2021."):
+        claim = facts.extract_claim(text)
+        assert str(claim.start) == "2021-03-15" and str(claim.end) == "2021-03-16"
+    assert facts.verify("Bitcoin closed above $60,000 on 15 March 2021.")[:2] == (False, 0.95)
+
+@pytest.mark.parametrize("text", [
+    "Bitcoin closed above $60,000 between 15-20 March 2021.",
+    "Bitcoin closed above $60,000 between March 15 and March 20, 2021.",
+    "Bitcoin closed above $55,000 on March 3, 2021 and on March 20, 2021.",
+])
+def test_extract_claim_rejects_ambiguous_days(facts, text):
+    assert facts.extract_claim(text) is None
+
+def test_extract_claim_ignores_unknown_assets_and_non_threshold_claims(facts):
+    assert facts.extract_claim("Ethereum closed above $2k on March 3, 2021.") is None
+    assert facts.extract_claim("Bitcoin was mentioned in the news in March 2021.") is None
+
+def test_verify_settles_clear_claims(facts):
+    assert facts.verify("Bitcoin closed above $50,500 on March 5, 2021.")[:2] == (True, 0.95)
+    assert facts.verify("Bitcoin closed above $60,000 on March 5, 2021.")[:2] == (False, 0.95)
+    assert facts.verify("Bitcoin traded over 60000 in March 2021.")[:2] == (True, 0.95)
+    assert facts.verify("Bitcoin fell below 45,000 in March 2021.")[:2] == (False, 0.95)
+    assert facts.verify("Bitcoin closed above $55k on 2021-03-20.")[4] == "deterministic_lookup"
+
+@pytest.mark.parametrize("text", [
+    "Bitcoin did not close above $52,000 on March 11, 2021.",
+    "Bitcoin didn't close above $52,000 on March 11, 2021.",
+    "Bitcoin failed to stay above $52,000 on March 11, 2021.",
+    "It is false that Bitcoin closed above $52,000 on March 11, 2021.",
+    "Bitcoin never traded below $45,000 in March 2021.",
+    "Bitcoin is no longer above $52,000 on March 11, 2021.",
+])
+def test_verify_leaves_negated_claims_to_the_llm(facts, text):
+    assert facts.extract_claim(text) is None
+    assert facts.verify(text) is None
+
+@pytest.mark.parametrize("text", [
+    "Bitcoin reached an all-time high of over $60,000 in March 2021.",
+    "Bitcoin closed above $60,000 for the first time in March 2021.",
+    "Bitcoin set a record above $60,000 in March 2021.",
+])
+def test_verify_leaves_qualified_claims_to_the_llm(facts, text):
+    assert facts.verify(text) is None
+
+def test_verify_is_inconclusive_without_margin_or_coverage(facts):
+    # Within 1% of the threshold
+    assert facts.verify("Bitcoin closed above $51,010 on March 3, 2021.") is None
+    # A false verdict needs every day of the month, April is missing
+    assert facts.verify("Bitcoin traded over $70,000 in April 2021.") is None
+
+@pytest.mark.parametrize("text", [
+    "Bitcoin rose more than 10% in March 2021.",
+    "Bitcoin dominance was above 60% in March 2021.",
+    "Bitcoin hashrate exceeded 150 EH/s in March 2021.",
+    "Bitcoin gained more than 10,000 in March 2021.",
+    "Bitcoin traded above 60% in March 2021.",
+    "Bitcoin exceeded 150 EH/s in March 2021.",
+])
+def test_verify_leaves_non_price_claims_to_the_llm(facts, text):
+    assert facts.verify(text) is None
+
+@pytest.mark.parametrize("text", [
+    "Bitcoin stayed above $52,000 throughout March 2021.",
+    "Bitcoin closed above $52,000 every day in March 2021.",
+    "Bitcoin remained above $52,000 for the whole of March 2021.",
+    "Bitcoin traded above $52,000 for the entire month of March 2021.",
+])
+def test_verify_leaves_universal_claims_to_the_llm(facts, text):
+    assert facts.verify(text) is None
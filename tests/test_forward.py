@@ -0,0 +1,64 @@
+# The MIT License (MIT)
+# Copyright © 2023 Bittensor "Brain" Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import types
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("bittensor")
+
+from brain import forward
+from brain.protocol import Statement
+
+class FakeDendrite:
+    """Dendrite whose requests never finish, recording which ones were cancelled."""
+    
+    def __init__(self):
+        self.started = 0
+        self.cancelled = 0
+        
+    async def forward(self, axons, synapse, deserialize, timeout):
+        self.started += 1
+        try:
+            await asyncio.sleep(timeout)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+def test_cancelled_query_cancels_requests_waiting_to_hedge(monkeypatch):
+    metagraph = types.SimpleNamespace(block=1, axons=[types.SimpleNamespace(is_serving=True)])
+    dendrite = FakeDendrite()
+    statement = Statement(id="1", text="Statement", timestamp="2021-03-01T00:00:00Z")
+    # A latency history makes the query wait 1.5 seconds before hedging
+    monkeypatch.setattr(forward, "_LATENCIES", {})
+    forward._record_latencies([0], [1.0])
+    
+    async def run():
+        responses = forward.iter_verification_responses(metagraph, dendrite, statement, timeout=5.0, hedge=True)
+        consumer = asyncio.ensure_future(responses.__anext__())
+        await asyncio.sleep(0.1)
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+        await asyncio.sleep(0.1)
+        await dendrite._session.close()
+        # Checked before asyncio.run cancels any leftover tasks itself
+        assert dendrite.started == 1
+        assert dendrite.cancelled == 1
+    
+    asyncio.run(run())
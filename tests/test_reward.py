@@ -0,0 +1,98 @@
+# The MIT License (MIT)
+# Copyright © 2023 Bittensor "Brain" Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("bittensor")
+
+from brain import reward
+from brain.protocol import PredictionResult, VerificationResponse, ValidationResponse
+
+# Expected rewards computed with the original per-response loops
+CONSENSUS_REWARDS = [0.699999988079071, 0.6700000166893005, 0.4650000035762787]
+GROUND_TRUTH_REWARDS = [0.7900000214576721, 0.23000000417232513, 0.4796999990940094]
+VALIDATION_REWARDS = [0.30000001192092896, 0.4699999988079071, 0.6000000238418579, 0.30000001192092896]
+
+def verification_response(is_true, confidence, evidence, explanation, methodology):
+    return VerificationResponse(
+        result=PredictionResult(
+            statement_id="1",
+            is_true=is_true,
+            confidence=confidence,
+            explanation="x" * explanation,
+            evidence=[{}] * evidence,
+            methodology="m" * methodology
+        ),
+        computation_time=0.0,
+        version="1"
+    )
+
+def validation_response(is_valid, explanation, alternative_result=None):
+    return ValidationResponse(
+        is_valid=is_valid,
+        confidence=0.5,
+        explanation="e" * explanation,
+        alternative_result=alternative_result
+    )
+
+@pytest.fixture(params=["jit", "numpy"])
+def kernel(request, monkeypatch):
+    if request.param == "numpy":
+        monkeypatch.setattr(reward, "_verification_reward_gt_kernel", None)
+    elif reward._verification_reward_gt_kernel is None:
+        pytest.skip("numba is not installed")
+
+def expected(values):
+    return torch.tensor(values, dtype=torch.float32)
+
+def test_consensus_rewards_match_baseline():
+    # The first response scores 0.4 + 0.3, which must round to just below 0.7
+    responses = [
+        verification_response(True, 0.9, 5, 0, 0),
+        verification_response(True, 0.2, 2, 250, 150),
+        verification_response(False, 0.8, 7, 600, 30),
+    ]
+    assert torch.equal(reward.calculate_verification_reward(responses), expected(CONSENSUS_REWARDS))
+
+def test_ground_truth_rewards_match_baseline(kernel):
+    responses = [
+        verification_response(True, 0.9, 5, 0, 0),
+        verification_response(False, 0.75, 1, 100, 0),
+        verification_response(True, 0.3, 3, 499, 10),
+    ]
+    rewards = reward.calculate_verification_reward(responses, {"is_true": True})
+    assert torch.equal(rewards, expected(GROUND_TRUTH_REWARDS))
+
+def test_validation_rewards_match_baseline():
+    responses = [
+        verification_response(True, 0.9, 5, 0, 0),
+        verification_response(True, 0.2, 2, 250, 150),
+        verification_response(False, 0.8, 7, 600, 30),
+    ]
+    validations = [
+        validation_response(True, 0),
+        validation_response(False, 150, responses[0].result),
+        validation_response(True, 300),
+        validation_response(False, 0),
+    ]
+    rewards = reward.calculate_validation_reward(validations, responses, expected(CONSENSUS_REWARDS))
+    assert torch.equal(rewards, expected(VALIDATION_REWARDS))
+
+def test_empty_responses():
+    assert reward.calculate_verification_reward([]).numel() == 0
+    assert reward.calculate_validation_reward([], [], torch.empty(0)).numel() == 0
@@ -0,0 +1,64 @@
+# The MIT License (MIT)
+# Copyright © 2023 Bittensor "Brain" Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+pytest.importorskip("bittensor")
+
+from neurons.statements import StatementTable, GroundTruthTable
+
+STATEMENTS = pd.DataFrame({
+    "id": ["1", "2"],
+    "text": ["Bitcoin closed above $50k on March 1, 2021.", "Ethereum closed above $2k on March 1, 2021."],
+    "timestamp": ["2021-03-01T00:00:00Z", "2021-03-02T00:00:00Z"],
+})
+
+def test_statement_table_loads_rows_lazily(tmp_path):
+    path = tmp_path / "statements.parquet"
+    STATEMENTS.to_parquet(path)
+    table = StatementTable(str(path))
+    assert len(table) == 2
+    statement = table[1]
+    assert (statement.id, statement.text, statement.timestamp) == ("2", STATEMENTS.text[1], "2021-03-02T00:00:00Z")
+    assert table[-1] == statement
+    with pytest.raises(IndexError):
+        table[2]
+
+def test_statement_table_formats_timestamp_and_id_columns(tmp_path):
+    path = tmp_path / "statements.parquet"
+    frame = STATEMENTS.assign(id=[1, 2], timestamp=pd.to_datetime(["2021-03-01 00:00", "2021-03-02 12:30"]))
+    frame.to_parquet(path)
+    statement = StatementTable(str(path))[1]
+    assert statement.id == "2"
+    assert statement.timestamp == "2021-03-02T12:30:00Z"
+
+def test_statement_table_reads_arrow_ipc(tmp_path):
+    path = tmp_path / "statements.arrow"
+    STATEMENTS.to_feather(path)
+    table = StatementTable(str(path))
+    assert len(table) == 2
+    assert table[0].text == STATEMENTS.text[0]
+
+def test_ground_truth_table_get(tmp_path):
+    path = tmp_path / "ground_truth.parquet"
+    pd.DataFrame({"id": ["1", "3"], "is_true": [True, False], "source": ["a", "b"]}).to_parquet(path)
+    ground_truth = GroundTruthTable(str(path))
+    assert ground_truth.get("3") == {"is_true": False, "source": "b"}
+    assert ground_truth.get("2") is None
+    assert ground_truth.get("2", {}) == {}